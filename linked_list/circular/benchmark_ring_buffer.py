@@ -0,0 +1,51 @@
+import time
+import tracemalloc
+
+from circular_singly.circular_singly import CircularSinglyLinkedList
+from circular_doubly.circular_doubly import CircularDoublyLinkedList
+from ring_buffer.ring_buffer import RingBuffer
+
+SIZES = [10_000, 100_000, 1_000_000]
+ROTATIONS = 1_000
+
+def timed(action):
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+def fill(ring, size):
+    # Alternate ends so both append and prepend are measured.
+    for i in range(size):
+        if i % 2:
+            ring.append(i)
+        else:
+            ring.prepend(i)
+
+def built_size(cls, size):
+    tracemalloc.start()
+    ring = cls()
+    fill(ring, size)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return ring, memory
+
+def round_robin(ring, rotations):
+    # The scheduling pattern: take the head and put it back at the tail.
+    for _ in range(rotations):
+        ring.rotate(1)
+
+def main():
+    print(f"{'size':>10} {'structure':>26} {'MiB':>7} {'fill (s)':>9} {'iterate (s)':>12} "
+          f"{'search (s)':>11} {'rotate (s)':>11}")
+    for size in SIZES:
+        for cls in (CircularSinglyLinkedList, CircularDoublyLinkedList, RingBuffer):
+            build = timed(lambda: fill(cls(), size))
+            ring, memory = built_size(cls, size)
+            iterate = timed(lambda: sum(ring))
+            search = timed(lambda: ring.search(-1))
+            rotate = timed(lambda: round_robin(ring, ROTATIONS))
+            print(f"{size:>10} {cls.__name__:>26} {memory / 2 ** 20:>7.1f} {build:>9.3f} {iterate:>12.4f} "
+                  f"{search:>11.4f} {rotate:>11.4f}")
+
+if __name__ == "__main__":
+    main()
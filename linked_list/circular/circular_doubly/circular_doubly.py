@@ -1,19 +1,77 @@
 class Node:
+    __slots__ = ('data', 'next', 'prev')
+
     def __init__(self, data: int):
         self.data = data
         self.next: 'Node' = None
         self.prev: 'Node' = None
 
 class CircularDoublyLinkedList:
-    def __init__(self):
+    def __init__(self, indexed: bool = False):
         self.head: Node = None
         self.tail: Node = None
+        self.size: int = 0
+        # Optional value -> {node: None} map. Only keys held once skip the
+        # scan; for a repeated key the walk from head finds the first node.
+        self.index: dict = {} if indexed else None
 
     def is_empty(self) -> bool:
         return self.head is None
 
+    def _index_add(self, node: Node) -> None:
+        if self.index is not None:
+            self.index.setdefault(node.data, {})[node] = None
+
+    def _index_discard(self, node: Node) -> None:
+        if self.index is not None:
+            nodes = self.index[node.data]
+            del nodes[node]
+            if not nodes:
+                del self.index[node.data]
+
+    def _index_chain(self, first: Node, last: Node) -> None:
+        if self.index is not None:
+            current = first
+            while True:
+                self._index_add(current)
+                if current is last:
+                    break
+                current = current.next
+
+    def _find(self, key: int) -> Node:
+        if self.index is not None:
+            nodes = self.index.get(key)
+            if not nodes:
+                return None
+            if len(nodes) == 1:
+                return next(iter(nodes))
+        current = self.head
+        while True:
+            if current.data == key:
+                return current
+            current = current.next
+            if current == self.head:
+                return None
+
+    def _unlink(self, node: Node) -> None:
+        if node.next is node:
+            self.head = None
+            self.tail = None
+        else:
+            node.prev.next = node.next
+            node.next.prev = node.prev
+            if node is self.head:
+                self.head = node.next
+            if node is self.tail:
+                self.tail = node.prev
+        node.next = node.prev = None
+        self._index_discard(node)
+        self.size -= 1
+
     def append(self, data: int) -> None:
         new_node = Node(data)
+        self._index_add(new_node)
+        self.size += 1
         if self.is_empty():
             self.head = new_node
             self.tail = new_node
@@ -26,8 +84,64 @@ class CircularDoublyLinkedList:
             self.head.prev = new_node
             self.tail = new_node
 
+    @classmethod
+    def from_iterable(cls, iterable, indexed: bool = False) -> 'CircularDoublyLinkedList':
+        linked_list = cls(indexed=indexed)
+        linked_list.extend(iterable)
+        return linked_list
+
+    def extend(self, iterable) -> None:
+        dummy = Node(None)
+        tail = dummy
+        count = 0
+        for data in iterable:
+            new_node = Node(data)
+            new_node.prev = tail
+            tail.next = tail = new_node
+            count += 1
+        head = dummy.next
+        if head is None:
+            return
+        self._index_chain(head, tail)
+        self.size += count
+        if self.is_empty():
+            self.head = head
+        else:
+            self.tail.next = head
+            head.prev = self.tail
+        self.tail = tail
+        self.tail.next = self.head
+        self.head.prev = self.tail
+
+    def extendleft(self, iterable) -> None:
+        head = tail = None
+        count = 0
+        for data in iterable:
+            new_node = Node(data)
+            new_node.next = head
+            if head is not None:
+                head.prev = new_node
+            head = new_node
+            if tail is None:
+                tail = new_node
+            count += 1
+        if head is None:
+            return
+        self._index_chain(head, tail)
+        self.size += count
+        if self.is_empty():
+            self.tail = tail
+        else:
+            tail.next = self.head
+            self.head.prev = tail
+        self.head = head
+        self.tail.next = self.head
+        self.head.prev = self.tail
+
     def prepend(self, data: int) -> None:
         new_node = Node(data)
+        self._index_add(new_node)
+        self.size += 1
         if self.is_empty():
             self.head = new_node
             self.tail = new_node
@@ -42,34 +156,139 @@ class CircularDoublyLinkedList:
 
     def delete(self, key: int) -> bool:
         if self.is_empty():
-            print("List is empty.")
             return False
+        node = self._find(key)
+        if node is None:
+            return False
+        self._unlink(node)
+        return True
 
-        current = self.head
-        while True:
-            if current.data == key:
-                if current == self.head and current == self.tail:
-                    self.head = None
-                    self.tail = None
-                else:
-                    if current == self.head:
-                        self.head = current.next
-                        self.head.prev = self.tail
-                        self.tail.next = self.head
-                    elif current == self.tail:
-                        self.tail = current.prev
-                        self.tail.next = self.head
-                        self.head.prev = self.tail
-                    else:
-                        current.prev.next = current.next
-                        current.next.prev = current.prev
-                return True
+    def delete_all(self, key: int) -> int:
+        if self.is_empty():
+            return 0
+        if self.index is not None:
+            nodes = list(self.index.get(key, ()))
+        else:
+            nodes = []
+            current = self.head
+            while True:
+                if current.data == key:
+                    nodes.append(current)
+                current = current.next
+                if current == self.head:
+                    break
+        for node in nodes:
+            self._unlink(node)
+        return len(nodes)
 
-            current = current.next
-            if current == self.head:
-                break
-        print("Key not found.")
-        return False
+    def clear(self) -> None:
+        # Dropping the references is enough; the garbage collector reclaims
+        # the ring.
+        self.head = self.tail = None
+        self.size = 0
+        if self.index is not None:
+            self.index = {}
+
+    def _node_at(self, pos: int) -> Node:
+        # Walk from whichever end of the ring is nearer.
+        if pos <= self.size - 1 - pos:
+            current = self.head
+            for _ in range(pos):
+                current = current.next
+        else:
+            current = self.tail
+            for _ in range(self.size - 1 - pos):
+                current = current.prev
+        return current
+
+    def insert_after_node(self, node: Node, data: int) -> Node:
+        new_node = Node(data)
+        self._index_add(new_node)
+        self.size += 1
+        new_node.next = node.next
+        new_node.prev = node
+        node.next.prev = new_node
+        node.next = new_node
+        if node is self.tail:
+            self.tail = new_node
+        return new_node
+
+    def remove_node(self, node: Node) -> int:
+        self._unlink(node)
+        return node.data
+
+    def insert_at(self, pos: int, data: int) -> Node:
+        if pos < 0 or pos > self.size:
+            raise IndexError("position out of range")
+        if pos == 0:
+            self.prepend(data)
+            return self.head
+        return self.insert_after_node(self._node_at(pos - 1), data)
+
+    def delete_at(self, pos: int) -> int:
+        if pos < 0 or pos >= self.size:
+            raise IndexError("position out of range")
+        return self.remove_node(self._node_at(pos))
+
+    def rotate(self, k: int = 1) -> None:
+        # Move head k nodes forward (backward for negative k), taking
+        # whichever direction round the ring is shorter.
+        if self.is_empty():
+            return
+        k %= self.size
+        if k <= self.size - k:
+            for _ in range(k):
+                self.head = self.head.next
+        else:
+            for _ in range(self.size - k):
+                self.head = self.head.prev
+        self.tail = self.head.prev
+
+    def splice(self, other: 'CircularDoublyLinkedList') -> None:
+        # Relinks other's whole chain after the tail with four pointer
+        # writes and empties other; the moved nodes join this ring's index.
+        if other is self:
+            raise ValueError("cannot splice a list into itself")
+        if other.is_empty():
+            return
+        head, tail = other.head, other.tail
+        self._index_chain(head, tail)
+        if self.is_empty():
+            self.head = head
+        else:
+            self.tail.next = head
+            head.prev = self.tail
+        self.tail = tail
+        self.tail.next = self.head
+        self.head.prev = self.tail
+        self.size += other.size
+        other.head = other.tail = None
+        other.size = 0
+        if other.index is not None:
+            other.index = {}
+
+    def eliminate_every(self, k: int):
+        # Yields values in the order the Josephus count removes them: every
+        # k-th node from the head, stepping whichever way round is shorter.
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        return self._eliminate(k)
+
+    def _eliminate(self, k: int):
+        current = self.head
+        while not self.is_empty():
+            steps = (k - 1) % self.size
+            if steps <= self.size - steps:
+                for _ in range(steps):
+                    current = current.next
+            else:
+                for _ in range(self.size - steps):
+                    current = current.prev
+            following = current.next
+            data = current.data
+            self._unlink(current)
+            current = following
+            yield data
 
     def display(self) -> None:
         if self.is_empty():
@@ -86,8 +305,9 @@ class CircularDoublyLinkedList:
 
     def search(self, key: int) -> bool:
         if self.is_empty():
-            print("List is empty.")
             return False
+        if self.index is not None:
+            return key in self.index
         current = self.head
         while True:
             if current.data == key:
@@ -98,38 +318,16 @@ class CircularDoublyLinkedList:
         return False
 
     def length(self) -> int:
-        if self.is_empty():
-            return 0
-        count = 0
-        current = self.head
-        while True:
-            count += 1
-            current = current.next
-            if current == self.head:
-                break
-        return count
+        return self.size
 
-    def insert_after(self, prev_data: int, new_data: int) -> None:
+    def insert_after(self, prev_data: int, new_data: int) -> bool:
         if self.is_empty():
-            print("List is empty.")
-            return
-
-        current = self.head
-        while True:
-            if current.data == prev_data:
-                new_node = Node(new_data)
-                new_node.next = current.next
-                new_node.prev = current
-                if current.next:
-                    current.next.prev = new_node
-                current.next = new_node
-                if current == self.tail:
-                    self.tail = new_node
-                return
-            current = current.next
-            if current == self.head:
-                break
-        print("Previous data not found.")
+            return False
+        current = self._find(prev_data)
+        if current is None:
+            return False
+        self.insert_after_node(current, new_data)
+        return True
 
     def __iter__(self):
         if self.is_empty():
@@ -1,73 +1,311 @@
 class Node:
+    __slots__ = ('data', 'next')
+
     def __init__(self, data: int):
         self.data = data
         self.next: 'Node' = None
 
 class CircularSinglyLinkedList:
-    def __init__(self):
+    def __init__(self, indexed: bool = False):
         self.head: Node = None
         self.tail: Node = None
+        self.size: int = 0
+        # Optional value -> {predecessor: None} map; the head's predecessor
+        # is the tail, so every node can be unlinked in O(1) through it.
+        # Predecessors are not kept in ring order, so a key stored more than
+        # once falls back to the walk from head.
+        self.index: dict = {} if indexed else None
 
     def is_empty(self) -> bool:
         return self.head is None
 
+    def _index_move(self, data: int, old_prev: Node, new_prev: Node) -> None:
+        preds = self.index[data]
+        del preds[old_prev]
+        preds[new_prev] = None
+
+    def _index_discard(self, data: int, prev: Node) -> None:
+        preds = self.index[data]
+        del preds[prev]
+        if not preds:
+            del self.index[data]
+
+    def _index_spliced(self, first: Node, last: Node, prev: Node, old_prev: Node) -> None:
+        # Index first..last, now linked after prev, and repoint the node
+        # following last, whose predecessor used to be old_prev. The follower
+        # is repointed first since it may share first's value and predecessor.
+        if old_prev is not None:
+            self._index_move(last.next.data, old_prev, last)
+        current = first
+        while True:
+            self.index.setdefault(current.data, {})[prev] = None
+            if current is last:
+                break
+            prev = current
+            current = current.next
+
+    def _link_after(self, prev: Node, new_node: Node) -> None:
+        # Links new_node after prev (or as the only node when prev is None);
+        # callers decide whether head or tail moves.
+        self.size += 1
+        if prev is None:
+            new_node.next = new_node
+            self.head = self.tail = new_node
+            if self.index is not None:
+                self.index.setdefault(new_node.data, {})[new_node] = None
+            return
+        following = prev.next
+        new_node.next = following
+        prev.next = new_node
+        if self.index is not None:
+            # Repoint the follower first: it may share new_node's value.
+            self._index_move(following.data, prev, new_node)
+            self.index.setdefault(new_node.data, {})[prev] = None
+
+    def _unlink_after(self, prev: Node) -> Node:
+        node = prev.next
+        self.size -= 1
+        if node is prev:
+            self.head = self.tail = None
+            if self.index is not None:
+                self._index_discard(node.data, node)
+            return node
+        following = node.next
+        prev.next = following
+        if node is self.head:
+            self.head = following
+        if node is self.tail:
+            self.tail = prev
+        if self.index is not None:
+            self._index_discard(node.data, prev)
+            self._index_move(following.data, node, prev)
+        node.next = None
+        return node
+
+    def _prev_of(self, node: Node) -> Node:
+        # Predecessor of node: found through the index when there is one,
+        # otherwise by walking from the head.
+        if node is self.head:
+            return self.tail
+        if self.index is not None:
+            for prev in self.index[node.data]:
+                if prev.next is node:
+                    return prev
+        prev = self.head
+        while prev.next is not node:
+            prev = prev.next
+        return prev
+
+    def _node_at(self, pos: int) -> Node:
+        current = self.head
+        for _ in range(pos):
+            current = current.next
+        return current
+
+    def _find_prev(self, key: int) -> Node:
+        # Predecessor of the first node holding key, or None when there is none.
+        if self.index is not None:
+            preds = self.index.get(key)
+            if not preds:
+                return None
+            if len(preds) == 1:
+                return next(iter(preds))
+        prev = self.tail
+        current = self.head
+        while True:
+            if current.data == key:
+                return prev
+            prev = current
+            current = current.next
+            if current == self.head:
+                return None
+
     def append(self, data: int) -> None:
-        new_node = Node(data)
+        self._link_after(self.tail, Node(data))
+        self.tail = self.tail.next
+
+    @classmethod
+    def from_iterable(cls, iterable, indexed: bool = False) -> 'CircularSinglyLinkedList':
+        linked_list = cls(indexed=indexed)
+        linked_list.extend(iterable)
+        return linked_list
+
+    def extend(self, iterable) -> None:
+        dummy = Node(None)
+        tail = dummy
+        count = 0
+        for data in iterable:
+            tail.next = tail = Node(data)
+            count += 1
+        head = dummy.next
+        if head is None:
+            return
+        self.size += count
+        old_tail = self.tail
         if self.is_empty():
-            self.head = new_node
-            self.tail = new_node
-            new_node.next = self.head
+            self.head = head
         else:
-            self.tail.next = new_node
-            new_node.next = self.head
-            self.tail = new_node
+            self.tail.next = head
+        tail.next = self.head
+        self.tail = tail
+        if self.index is not None:
+            self._index_spliced(head, tail, old_tail or tail, old_tail)
+
+    def extendleft(self, iterable) -> None:
+        head = tail = None
+        count = 0
+        for data in iterable:
+            new_node = Node(data)
+            new_node.next = head
+            head = new_node
+            if tail is None:
+                tail = new_node
+            count += 1
+        if head is None:
+            return
+        self.size += count
+        old_tail = self.tail
+        if self.is_empty():
+            self.tail = tail
+        else:
+            tail.next = self.head
+        self.head = head
+        self.tail.next = self.head
+        if self.index is not None:
+            self._index_spliced(head, tail, self.tail, old_tail)
 
     def prepend(self, data: int) -> None:
         new_node = Node(data)
-        if self.is_empty():
-            self.head = new_node
-            self.tail = new_node
-            new_node.next = self.head
-        else:
-            new_node.next = self.head
-            self.head = new_node
-            self.tail.next = new_node
+        self._link_after(self.tail, new_node)
+        self.head = new_node
 
     def delete(self, key: int) -> bool:
         if self.is_empty():
-            print("List is empty.")
             return False
+        prev = self._find_prev(key)
+        if prev is None:
+            return False
+        self._unlink_after(prev)
+        return True
 
-        current = self.head
-        previous = None
-
-        while True:
-            if current.data == key:
-                if previous:
-                    previous.next = current.next
-                    if current == self.tail:
-                        self.tail = previous
-                else:
-                    if self.head == self.tail:
-                        self.head = None
-                        self.tail = None
-                    else:
-                        temp = self.head
-                        while temp.next != self.head:
-                            temp = temp.next
-                        temp.next = current.next
-                        self.head = current.next
-                        self.tail.next = self.head
-                return True
-
-            previous = current
-            current = current.next
+    def pop_front(self) -> int:
+        if self.is_empty():
+            raise IndexError("pop from an empty list")
+        # The tail is the head's predecessor, so this never walks.
+        return self._unlink_after(self.tail).data
 
-            if current == self.head:
-                break
-        print("Key not found.")
-        return False
+    def pop_back(self) -> int:
+        if self.is_empty():
+            raise IndexError("pop from an empty list")
+        return self._unlink_after(self._prev_of(self.tail)).data
 
+    def peek(self) -> int:
+        if self.is_empty():
+            raise IndexError("peek at an empty list")
+        return self.head.data
+
+    def clear(self) -> None:
+        # Dropping the references is enough; the garbage collector reclaims
+        # the ring.
+        self.head = self.tail = None
+        self.size = 0
+        if self.index is not None:
+            self.index = {}
+
+    def insert_after_node(self, node: Node, data: int) -> Node:
+        new_node = Node(data)
+        self._link_after(node, new_node)
+        if node is self.tail:
+            self.tail = new_node
+        return new_node
+
+    def remove_node(self, node: Node) -> int:
+        # A singly linked node does not know its predecessor, so this is
+        # O(1) only for the head (or with an index); otherwise one walk.
+        return self._unlink_after(self._prev_of(node)).data
+
+    def insert_at(self, pos: int, data: int) -> Node:
+        if pos < 0 or pos > self.size:
+            raise IndexError("position out of range")
+        if pos == 0:
+            self.prepend(data)
+            return self.head
+        if pos == self.size:
+            self.append(data)
+            return self.tail
+        return self.insert_after_node(self._node_at(pos - 1), data)
+
+    def delete_at(self, pos: int) -> int:
+        if pos < 0 or pos >= self.size:
+            raise IndexError("position out of range")
+        prev = self.tail if pos == 0 else self._node_at(pos - 1)
+        return self._unlink_after(prev).data
+
+    def rotate(self, k: int = 1) -> None:
+        # Move head k nodes forward (backward for negative k). The ring
+        # itself is untouched, so the predecessor index stays valid.
+        if self.is_empty():
+            return
+        for _ in range(k % self.size):
+            self.tail = self.head
+            self.head = self.head.next
+
+    def splice(self, other: 'CircularSinglyLinkedList') -> None:
+        # Move all of other's nodes to the end of this ring in O(1); other is
+        # left empty. An indexed ring also indexes the moved nodes.
+        if other is self:
+            raise ValueError("cannot splice a list into itself")
+        if other.is_empty():
+            return
+        head, tail = other.head, other.tail
+        old_tail = self.tail
+        if self.is_empty():
+            self.head = head
+        else:
+            self.tail.next = head
+            tail.next = self.head
+        self.tail = tail
+        self.size += other.size
+        if self.index is not None:
+            self._index_spliced(head, tail, old_tail or tail, old_tail)
+        other.head = other.tail = None
+        other.size = 0
+        if other.index is not None:
+            other.index = {}
+
+    def eliminate_every(self, k: int):
+        # Josephus elimination: counting from the head, remove every k-th
+        # node until the ring is empty, yielding each removed value in turn.
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        return self._eliminate(k)
+
+    def _eliminate(self, k: int):
+        prev = self.tail
+        while not self.is_empty():
+            for _ in range((k - 1) % self.size):
+                prev = prev.next
+            yield self._unlink_after(prev).data
+
+    def delete_all(self, key: int) -> int:
+        removed = 0
+        if self.is_empty():
+            return removed
+        if self.index is not None:
+            while key in self.index:
+                self._unlink_after(next(iter(self.index[key])))
+                removed += 1
+            return removed
+        prev = self.tail
+        for _ in range(self.length()):
+            if prev.next.data == key:
+                self._unlink_after(prev)
+                removed += 1
+                if self.is_empty():
+                    break
+            else:
+                prev = prev.next
+        return removed
 
     def display(self) -> None:
         if self.is_empty():
@@ -84,8 +322,9 @@ class CircularSinglyLinkedList:
 
     def search(self, key: int) -> bool:
         if self.is_empty():
-            print("List is empty.")
             return False
+        if self.index is not None:
+            return key in self.index
         current = self.head
         while True:
             if current.data == key:
@@ -96,35 +335,19 @@ class CircularSinglyLinkedList:
         return False
 
     def length(self) -> int:
-        if self.is_empty():
-            return 0
-        count = 0
-        current = self.head
-        while True:
-            count += 1
-            current = current.next
-            if current == self.head:
-                break
-        return count
+        return self.size
 
-    def insert_after(self, prev_data: int, new_data: int) -> None:
+    def insert_after(self, prev_data: int, new_data: int) -> bool:
         if self.is_empty():
-            print("List is empty.")
-            return
-
-        current = self.head
-        while True:
-            if current.data == prev_data:
-                new_node = Node(new_data)
-                new_node.next = current.next
-                current.next = new_node
-                if current == self.tail:
-                    self.tail = new_node
-                return
-            current = current.next
-            if current == self.head:
-                break
-        print("Previous data not found.")
+            return False
+        prev = self._find_prev(prev_data)
+        if prev is None:
+            return False
+        current = prev.next
+        self._link_after(current, Node(new_data))
+        if current == self.tail:
+            self.tail = current.next
+        return True
 
     def __iter__(self):
         if self.is_empty():
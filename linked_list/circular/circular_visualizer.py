@@ -1,13 +1,22 @@
+import sys
 import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox
 from tkinter import filedialog
 import time
+from collections import deque
 from circular_singly.circular_singly import CircularSinglyLinkedList
 from circular_doubly.circular_doubly import CircularDoublyLinkedList
+from ring_buffer.ring_buffer import RingBuffer
+
+NODE_STEP = 80
+# Nodes rendered on each side of the visible window
+RENDER_MARGIN = 5
+# Longest stretch of queued operations run before yielding to the event loop
+OPERATION_BATCH_SECONDS = 0.015
 
 class CircularLinkedListVisualizer(tk.Tk):
-    def __init__(self):
+    def __init__(self, use_ring_buffer=False):
         super().__init__()
         self.title("Circular Linked List Visualizer")
         self.geometry("1200x800")
@@ -20,19 +29,33 @@ class CircularLinkedListVisualizer(tk.Tk):
         self.doubly_frame = tk.Frame(self.tab_control)
         
         self.tab_control.add(self.singly_frame, text='Circular Singly Linked List')
-        self.tab_control.add(self.doubly_frame, text='Circular Doubly Linked List')
+        self.tab_control.add(self.doubly_frame, text='Ring Buffer' if use_ring_buffer else 'Circular Doubly Linked List')
         self.tab_control.pack(expand=1, fill="both")
+        self.tab_control.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+        # Rings changed since they were last drawn
+        self.dirty = {'singly', 'doubly'}
+
+        self.operations = deque()
+        self.processing = False
+        self.redraw_pending = False
+        self.backlog_label = tk.Label(self, anchor=tk.W)
+        self.backlog_label.pack(fill=tk.X, padx=10)
+        self.update_backlog()
         
         # Initialize both types of lists
         self.singly_list = CircularSinglyLinkedList()
-        self.doubly_list = CircularDoublyLinkedList()
+        self.doubly_list = RingBuffer() if use_ring_buffer else CircularDoublyLinkedList()
         
         # Create separate canvases for each list type
         self.singly_canvas = tk.Canvas(self.singly_frame, width=1100, height=400, bg='white')
         self.doubly_canvas = tk.Canvas(self.doubly_frame, width=1100, height=400, bg='white')
         
-        self.singly_canvas.pack(pady=20)
-        self.doubly_canvas.pack(pady=20)
+        self.singly_canvas.pack(pady=(20, 0))
+        self.doubly_canvas.pack(pady=(20, 0))
+        self.ring_views = {
+            'singly': self.create_ring_view(self.singly_frame, self.singly_canvas, 'singly'),
+            'doubly': self.create_ring_view(self.doubly_frame, self.doubly_canvas, 'doubly'),
+        }
         
         self.create_controls()
         self.update_visualization()
@@ -113,6 +136,9 @@ class CircularLinkedListVisualizer(tk.Tk):
         tk.Button(utility_ops_frame, text="Display List", 
                  command=lambda: self.display_list('singly'),
                  width=button_width).pack(pady=2)
+        tk.Button(utility_ops_frame, text="Go To Position",
+                 command=lambda: self.go_to_position('singly'),
+                 width=button_width).pack(pady=2)
 
         # Controls for Doubly Linked List
         doubly_control_frame = tk.Frame(self.doubly_frame)
@@ -188,6 +214,9 @@ class CircularLinkedListVisualizer(tk.Tk):
         tk.Button(doubly_utility_ops_frame, text="Display List", 
                  command=lambda: self.display_list('doubly'),
                  width=button_width).pack(pady=2)
+        tk.Button(doubly_utility_ops_frame, text="Go To Position",
+                 command=lambda: self.go_to_position('doubly'),
+                 width=button_width).pack(pady=2)
 
     def get_value_and_position(self, list_type='singly'):
         try:
@@ -203,65 +232,58 @@ class CircularLinkedListVisualizer(tk.Tk):
             prev_value = int(self.singly_position_entry.get() if list_type == 'singly' else self.doubly_position_entry.get())
             new_value = int(self.singly_entry.get() if list_type == 'singly' else self.doubly_entry.get())
             if list_type == 'singly':
-                self.singly_list.insert_after(prev_value, new_value)
+                self.queue_operation(list_type, lambda: self.singly_list.insert_after(prev_value, new_value))
             else:
-                self.doubly_list.insert_after(prev_value, new_value)
-            self.update_visualization()
+                self.queue_operation(list_type, lambda: self.doubly_list.insert_after(prev_value, new_value))
         except ValueError:
             messagebox.showerror("Error", "Please enter valid integers")
 
     def insert_at_position(self, list_type):
         value, position = self.get_value_and_position(list_type)
         if value is not None and position is not None:
-            if list_type == 'singly':
-                # Add implementation for insert at position
-                current = self.singly_list.head
-                if position == 0:
-                    self.singly_list.prepend(value)
-                else:
-                    count = 0
-                    while count < position - 1 and current is not None:
-                        current = current.next
-                        count += 1
-                    if current is not None:
-                        self.singly_list.insert_after(current.data, value)
-                self.update_visualization()
+            self.run_pending()
+            _, linked_list, _, _ = self.ring_parts(list_type)
+            if position < 0 or position > linked_list.length():
+                messagebox.showerror("Error", "Position is out of range")
+                return
+            self.queue_operation(list_type, lambda: linked_list.insert_at(position, value))
 
     def delete_first(self, list_type):
-        if list_type == 'singly':
-            if not self.singly_list.is_empty():
-                self.singly_list.delete(self.singly_list.head.data)
-                self.update_visualization()
-            else:
-                messagebox.showinfo("Info", "List is empty")
+        self.run_pending()
+        _, linked_list, _, _ = self.ring_parts(list_type)
+        if linked_list.is_empty():
+            messagebox.showinfo("Info", "List is empty")
+        elif list_type == 'singly':
+            self.queue_operation(list_type, linked_list.pop_front)
+        else:
+            self.queue_operation(list_type, lambda: linked_list.delete_at(0))
 
     def delete_last(self, list_type):
-        if list_type == 'singly':
-            if not self.singly_list.is_empty():
-                self.singly_list.delete(self.singly_list.tail.data)
-                self.update_visualization()
-            else:
-                messagebox.showinfo("Info", "List is empty")
+        self.run_pending()
+        _, linked_list, _, _ = self.ring_parts(list_type)
+        if linked_list.is_empty():
+            messagebox.showinfo("Info", "List is empty")
+        elif list_type == 'singly':
+            self.queue_operation(list_type, linked_list.pop_back)
+        else:
+            self.queue_operation(list_type, lambda: linked_list.delete_at(linked_list.length() - 1))
 
     def delete_at_position(self, list_type):
+        entry = self.singly_position_entry if list_type == 'singly' else self.doubly_position_entry
         try:
-            position = int(self.singly_position_entry.get())
-            if list_type == 'singly':
-                current = self.singly_list.head
-                if position == 0:
-                    self.delete_first(list_type)
-                else:
-                    count = 0
-                    while count < position and current is not None:
-                        current = current.next
-                        count += 1
-                    if current is not None:
-                        self.singly_list.delete(current.data)
-                self.update_visualization()
+            position = int(entry.get())
         except ValueError:
             messagebox.showerror("Error", "Please enter a valid position")
+            return
+        self.run_pending()
+        _, linked_list, _, _ = self.ring_parts(list_type)
+        if position < 0 or position >= linked_list.length():
+            messagebox.showerror("Error", "Position is out of range")
+            return
+        self.queue_operation(list_type, lambda: linked_list.delete_at(position))
 
     def show_length(self, list_type):
+        self.run_pending()
         length = 0
         if list_type == 'singly':
             length = self.singly_list.length()
@@ -270,15 +292,11 @@ class CircularLinkedListVisualizer(tk.Tk):
         messagebox.showinfo("List Length", f"The {list_type} list contains {length} nodes")
 
     def clear_list(self, list_type):
-        if list_type == 'singly':
-            while not self.singly_list.is_empty():
-                self.singly_list.delete(self.singly_list.head.data)
-        else:
-            while not self.doubly_list.is_empty():
-                self.doubly_list.delete(self.doubly_list.head.data)
-        self.update_visualization()
+        _, linked_list, _, _ = self.ring_parts(list_type)
+        self.queue_operation(list_type, linked_list.clear)
 
     def display_list(self, list_type):
+        self.drain_operations()
         elements = []
         if list_type == 'singly':
             if not self.singly_list.is_empty():
@@ -289,13 +307,7 @@ class CircularLinkedListVisualizer(tk.Tk):
                     if current == self.singly_list.head:
                         break
         else:
-            if not self.doubly_list.is_empty():
-                current = self.doubly_list.head
-                while True:
-                    elements.append(str(current.data))
-                    current = current.next
-                    if current == self.doubly_list.head:
-                        break
+            elements = [str(data) for data in self.doubly_list]
         
         separator = " -> " if list_type == 'singly' else " <-> "
         messagebox.showinfo("List Contents", 
@@ -306,15 +318,14 @@ class CircularLinkedListVisualizer(tk.Tk):
             value = int(self.singly_entry.get() if list_type == 'singly' else self.doubly_entry.get())
             if operation == 'append':
                 if list_type == 'singly':
-                    self.singly_list.append(value)
+                    self.queue_operation(list_type, lambda: self.singly_list.append(value))
                 else:
-                    self.doubly_list.append(value)
+                    self.queue_operation(list_type, lambda: self.doubly_list.append(value))
             else:  # prepend
                 if list_type == 'singly':
-                    self.singly_list.prepend(value)
+                    self.queue_operation(list_type, lambda: self.singly_list.prepend(value))
                 else:
-                    self.doubly_list.prepend(value)
-            self.update_visualization()
+                    self.queue_operation(list_type, lambda: self.doubly_list.prepend(value))
         except ValueError:
             messagebox.showerror("Error", "Please enter a valid integer")
 
@@ -322,16 +333,16 @@ class CircularLinkedListVisualizer(tk.Tk):
         try:
             value = int(self.singly_entry.get() if list_type == 'singly' else self.doubly_entry.get())
             if list_type == 'singly':
-                self.singly_list.delete(value)
+                self.queue_operation(list_type, lambda: self.singly_list.delete(value))
             else:
-                self.doubly_list.delete(value)
-            self.update_visualization()
+                self.queue_operation(list_type, lambda: self.doubly_list.delete(value))
         except ValueError:
             messagebox.showerror("Error", "Please enter a valid integer")
 
     def search_node(self, list_type):
         try:
             value = int(self.singly_entry.get() if list_type == 'singly' else self.doubly_entry.get())
+            self.drain_operations()
             found = False
             if list_type == 'singly':
                 found = self.singly_list.search(value)
@@ -342,71 +353,230 @@ class CircularLinkedListVisualizer(tk.Tk):
         except ValueError:
             messagebox.showerror("Error", "Please enter a valid integer")
 
+    def queue_operation(self, list_type, operation):
+        # Operations run against the lists as soon as the event loop is idle,
+        # in batches bounded by OPERATION_BATCH_SECONDS, and all operations
+        # of a batch share a single redraw.
+        self.operations.append((list_type, operation))
+        self.update_backlog()
+        if not self.processing:
+            self.processing = True
+            self.after_idle(self.process_operations)
+
+    def process_operations(self):
+        deadline = time.perf_counter() + OPERATION_BATCH_SECONDS
+        while self.operations and time.perf_counter() < deadline:
+            self.run_operation()
+        self.request_redraw()
+        self.update_backlog()
+        if self.operations:
+            # Yield to the event loop so the redraw and input get a turn.
+            self.after(1, self.process_operations)
+        else:
+            self.processing = False
+
+    def run_pending(self):
+        # Run everything still queued, so a check against a list sees its
+        # latest state; the canvases catch up with the next idle redraw.
+        if self.operations:
+            while self.operations:
+                self.run_operation()
+            self.request_redraw()
+            self.update_backlog()
+
+    def drain_operations(self):
+        # Also redraw now, for reads that show a list or scroll a canvas.
+        self.run_pending()
+        self.flush_redraw()
+
+    def run_operation(self):
+        # The ring is marked dirty once the operation has run, so a render
+        # in between cannot clear the flag on the old contents.
+        list_type, operation = self.operations.popleft()
+        operation()
+        self.dirty.add(list_type)
+
+    def request_redraw(self):
+        if not self.redraw_pending:
+            self.redraw_pending = True
+            self.after_idle(self.flush_redraw)
+
+    def flush_redraw(self):
+        if self.redraw_pending:
+            self.redraw_pending = False
+            self.update_visualization()
+
+    def update_backlog(self):
+        self.backlog_label.configure(text=f"Pending operations: {len(self.operations)}")
+
     def update_visualization(self):
-        # Clear both canvases
-        self.singly_canvas.delete("all")
-        self.doubly_canvas.delete("all")
-
-        # Update Singly Linked List visualization
-        if not self.singly_list.is_empty():
-            x, y = 50, 200
-            current = self.singly_list.head
-            first_node = current
-            first_x = x
-
-            while True:
-                # Draw node
-                self.singly_canvas.create_oval(x-20, y-20, x+20, y+20, fill="lightblue")
-                self.singly_canvas.create_text(x, y, text=str(current.data))
-                
-                if current == self.singly_list.head:
-                    self.singly_canvas.create_text(x, y-30, text="Head")
-                if current == self.singly_list.tail:
-                    self.singly_canvas.create_text(x, y+30, text="Tail")
-                
-                current = current.next
-                if current != first_node:
-                    # Draw forward arrow
-                    self.singly_canvas.create_line(x+20, y, x+60, y, arrow=tk.LAST)
-                    x += 80
-                else:
-                    # Draw circular arrow back to first node
-                    self.singly_canvas.create_line(x+20, y, x+40, y, x+40, y-40, 
-                                                 first_x-40, y-40, first_x-40, y, 
-                                                 first_x-20, y, smooth=True, arrow=tk.LAST)
-                    break
-
-        # Update Doubly Linked List visualization
-        if not self.doubly_list.is_empty():
-            x, y = 50, 200
-            current = self.doubly_list.head
-            first_node = current
-            first_x = x
-
-            while True:
-                # Draw node
-                self.doubly_canvas.create_oval(x-20, y-20, x+20, y+20, fill="lightgreen")
-                self.doubly_canvas.create_text(x, y, text=str(current.data))
-                
-                if current == self.doubly_list.head:
-                    self.doubly_canvas.create_text(x, y-30, text="Head")
-                if current == self.doubly_list.tail:
-                    self.doubly_canvas.create_text(x, y+30, text="Tail")
-                
-                current = current.next
-                if current != first_node:
-                    # Draw bidirectional arrow
-                    self.doubly_canvas.create_line(x+20, y, x+60, y, arrow=tk.BOTH)
-                    x += 80
-                else:
-                    # Draw circular bidirectional arrows
-                    self.doubly_canvas.create_line(x+20, y, x+40, y, x+40, y-40, 
-                                                 first_x-40, y-40, first_x-40, y, 
-                                                 first_x-20, y, smooth=True, arrow=tk.BOTH)
-                    break
+        # Only the visible ring is redrawn. A hidden ring that changed stays
+        # dirty until its tab is selected.
+        list_type = self.active_list_type()
+        if list_type in self.dirty:
+            self.render_ring(list_type)
+
+    def active_list_type(self):
+        return 'singly' if self.tab_control.select() == str(self.singly_frame) else 'doubly'
+
+    def on_tab_changed(self, event):
+        self.update_visualization()
+
+    def create_ring_view(self, frame, canvas, list_type):
+        scrollbar = tk.Scrollbar(frame, orient=tk.HORIZONTAL,
+                                 command=lambda *args: self.scroll_ring(list_type, *args))
+        scrollbar.pack(fill=tk.X)
+        canvas.configure(xscrollcommand=scrollbar.set)
+        canvas.bind("<Configure>", lambda event: self.render_ring(list_type))
+        return {
+            'items': {},
+            'head_label': canvas.create_text(0, 0, text="Head", state=tk.HIDDEN),
+            'tail_label': canvas.create_text(0, 0, text="Tail", state=tk.HIDDEN),
+            'back_arrow': None,
+            'back_x': None,
+            'size': 0,
+            'cursor': None,
+        }
+
+    def ring_parts(self, list_type):
+        if list_type == 'singly':
+            return self.singly_canvas, self.singly_list, "lightblue", tk.LAST
+        return self.doubly_canvas, self.doubly_list, "lightgreen", tk.BOTH
+
+    def render_ring(self, list_type):
+        # Only nodes inside the visible part of the scroll region (plus a
+        # margin) get canvas items. Nodes that stay in view keep their items
+        # and only those whose slot, value or outgoing link changed are touched.
+        canvas, linked_list, fill, arrow = self.ring_parts(list_type)
+        view = self.ring_views[list_type]
+        changed = list_type in self.dirty
+        if changed:
+            # The ring may have changed shape: recount and drop the cursor.
+            self.dirty.discard(list_type)
+            view['size'] = linked_list.length()
+            view['cursor'] = None
+        size = view['size']
+        first_x, y = 50, 200
+        canvas.configure(scrollregion=(0, 0, first_x + NODE_STEP * size, 400))
+        left = canvas.canvasx(0)
+        width = max(canvas.winfo_width(), int(canvas['width']))
+        first = max(0, int(left - first_x) // NODE_STEP - RENDER_MARGIN)
+        last = min(size, int(left + width - first_x) // NODE_STEP + 1 + RENDER_MARGIN)
+
+        previous = view['items']
+        view['items'] = {}
+        entries = self.ring_entries(list_type, first, last) if first < last else ()
+        for index, (key, data) in enumerate(entries, first):
+            x = first_x + NODE_STEP * index
+            items = previous.pop(key, None)
+            if items is None:
+                oval = canvas.create_oval(x-20, y-20, x+20, y+20, fill=fill)
+                text = canvas.create_text(x, y, text=str(data))
+                items = [oval, text, None, x, data]
+            else:
+                self.move_node_items(canvas, items, data, x)
+            has_next = index < size - 1
+            if has_next and items[2] is None:
+                items[2] = canvas.create_line(x+20, y, x+60, y, arrow=arrow)
+            elif not has_next and items[2] is not None:
+                canvas.delete(items[2])
+                items[2] = None
+            view['items'][key] = items
+
+        for items in previous.values():
+            canvas.delete(*(item for item in items[:3] if item is not None))
+
+        if size == 0:
+            canvas.itemconfigure(view['head_label'], state=tk.HIDDEN)
+            canvas.itemconfigure(view['tail_label'], state=tk.HIDDEN)
+            if view['back_arrow'] is not None:
+                canvas.delete(view['back_arrow'])
+                view['back_arrow'] = None
+            return
+        last_x = first_x + NODE_STEP * (size - 1)
+        canvas.coords(view['head_label'], first_x, y-30)
+        canvas.coords(view['tail_label'], last_x, y+30)
+        canvas.itemconfigure(view['head_label'], state=tk.NORMAL)
+        canvas.itemconfigure(view['tail_label'], state=tk.NORMAL)
+        # Circular arrow from the tail back to the first node
+        back = (last_x+20, y, last_x+40, y, last_x+40, y-40,
+                first_x-40, y-40, first_x-40, y, first_x-20, y)
+        if view['back_arrow'] is None:
+            view['back_arrow'] = canvas.create_line(*back, smooth=True, arrow=arrow)
+        elif view['back_x'] != last_x:
+            canvas.coords(view['back_arrow'], *back)
+        view['back_x'] = last_x
+
+    def ring_entries(self, list_type, first, last):
+        # (key, value) pairs for positions first..last-1. Node rings key
+        # their canvas items by node, so items follow a node when it moves;
+        # the ring buffer has no nodes and keys them by position.
+        _, linked_list, _, _ = self.ring_parts(list_type)
+        if isinstance(linked_list, RingBuffer):
+            return enumerate(linked_list.view(first, last), first)
+        return self.ring_nodes(list_type, first, last)
+
+    def ring_nodes(self, list_type, first, last):
+        current = self.ring_node_at(list_type, first)
+        self.ring_views[list_type]['cursor'] = (first, current)
+        for _ in range(first, last):
+            yield current, current.data
+            current = current.next
+
+    def ring_node_at(self, list_type, index):
+        _, linked_list, _, _ = self.ring_parts(list_type)
+        cursor = self.ring_views[list_type]['cursor']
+        if list_type == 'doubly' and cursor is not None and cursor[0] > index and cursor[0] - index < index:
+            # Closer to the cursor than to the head: walk the prev links back.
+            i, node = cursor
+            while i > index:
+                node = node.prev
+                i -= 1
+            return node
+        if cursor is not None and cursor[0] <= index:
+            i, node = cursor
+        else:
+            i, node = 0, linked_list.head
+        while i < index:
+            node = node.next
+            i += 1
+        return node
+
+    def scroll_ring(self, list_type, *args):
+        canvas, _, _, _ = self.ring_parts(list_type)
+        canvas.xview(*args)
+        self.render_ring(list_type)
+
+    def go_to_position(self, list_type):
+        canvas, _, _, _ = self.ring_parts(list_type)
+        entry = self.singly_position_entry if list_type == 'singly' else self.doubly_position_entry
+        try:
+            position = int(entry.get())
+        except ValueError:
+            messagebox.showerror("Error", "Please enter a valid position")
+            return
+        self.drain_operations()
+        size = self.ring_views[list_type]['size']
+        if position < 0 or position >= size:
+            messagebox.showerror("Error", "Position is out of range")
+            return
+        width = max(canvas.winfo_width(), int(canvas['width']))
+        canvas.xview_moveto(max(0, 50 + NODE_STEP * position - width // 2) / (50 + NODE_STEP * size))
+        self.render_ring(list_type)
+
+    def move_node_items(self, canvas, items, data, x):
+        oval, text, arrow, old_x, old_data = items
+        if old_x != x:
+            for item in (oval, text, arrow):
+                if item is not None:
+                    canvas.move(item, x - old_x, 0)
+            items[3] = x
+        if old_data != data:
+            canvas.itemconfigure(text, text=str(data))
+            items[4] = data
 
 if __name__ == "__main__":
-    app = CircularLinkedListVisualizer()
+    app = CircularLinkedListVisualizer(use_ring_buffer="--ring-buffer" in sys.argv)
     app.mainloop()
 
 
@@ -0,0 +1,142 @@
+import threading
+
+from circular_doubly.circular_doubly import CircularDoublyLinkedList
+
+class RingNode:
+    __slots__ = ('data', 'next')
+
+    def __init__(self, data: int):
+        self.data = data
+        self.next = None
+
+class LockedRing:
+    # CircularDoublyLinkedList shared between threads behind one lock.
+    # Producers and consumers all contend for that lock; it is the baseline
+    # TwoLockRing is measured against.
+    def __init__(self, capacity: int = None):
+        self.ring = CircularDoublyLinkedList()
+        self.capacity = capacity
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+
+    def push_back(self, data: int, timeout: float = None) -> bool:
+        # Blocks while the ring is at capacity; False if no room frees up
+        # within timeout.
+        with self.not_full:
+            if self.capacity is not None and not self.not_full.wait_for(
+                    lambda: self.ring.length() < self.capacity, timeout):
+                return False
+            self.ring.append(data)
+            self.not_empty.notify()
+        return True
+
+    def pop_front(self, timeout: float = None) -> int:
+        # Blocks while the ring is empty; IndexError if nothing arrives
+        # within timeout.
+        with self.not_empty:
+            if not self.not_empty.wait_for(lambda: not self.ring.is_empty(), timeout):
+                raise IndexError("pop from an empty list")
+            data = self.ring.delete_at(0)
+            self.not_full.notify()
+        return data
+
+    def is_empty(self) -> bool:
+        return self.length() == 0
+
+    def length(self) -> int:
+        with self.lock:
+            return self.ring.length()
+
+    def __len__(self) -> int:
+        return self.length()
+
+class TwoLockRing:
+    # FIFO work ring with separate locks for the two ends (the Michael-Scott
+    # two-lock queue). The chain always starts with a dummy node, so
+    # push_back only touches the tail and pop_front only the head, and a
+    # producer and a consumer never wait for each other. Emptiness is
+    # head.next being None, so an unbounded ring keeps no shared counter.
+    # Closing the chain into a ring would make both ends share the
+    # tail-to-head link, so it is kept open; the element order is the same.
+    def __init__(self, capacity: int = None):
+        self.head = self.tail = RingNode(None)
+        self.capacity = capacity
+        # With a capacity, each end counts its own operations under its own
+        # lock; the difference is the size.
+        self.pushed = 0
+        self.popped = 0
+        self.head_lock = threading.Lock()
+        self.tail_lock = threading.Lock()
+        self.not_empty = threading.Condition(self.head_lock)
+        self.not_full = threading.Condition(self.tail_lock)
+
+    def push_back(self, data: int, timeout: float = None) -> bool:
+        # Blocks while the ring is at capacity; False if no room frees up
+        # within timeout.
+        node = RingNode(data)
+        with self.not_full:
+            if self.capacity is not None:
+                if not self.not_full.wait_for(lambda: self.pushed - self.popped < self.capacity, timeout):
+                    return False
+                self.pushed += 1
+                if self.pushed - self.popped < self.capacity:
+                    # Pass the wake-up on to the next waiting producer.
+                    self.not_full.notify()
+            self.tail.next = node
+            self.tail = node
+        if self.head.next is node:
+            # The ring was empty, so consumers may be waiting.
+            with self.not_empty:
+                self.not_empty.notify()
+        return True
+
+    def pop_front(self, timeout: float = None) -> int:
+        # Blocks while the ring is empty; IndexError if nothing arrives
+        # within timeout.
+        with self.not_empty:
+            if not self.not_empty.wait_for(lambda: self.head.next is not None, timeout):
+                raise IndexError("pop from an empty list")
+            # The first real node becomes the new dummy.
+            node = self.head.next
+            self.head = node
+            data, node.data = node.data, None
+            if node.next is not None:
+                # Pass the wake-up on to the next waiting consumer.
+                self.not_empty.notify()
+            if self.capacity is not None:
+                self.popped += 1
+                # Read pushed after counting the pop, so a producer that saw
+                # the ring full is always woken.
+                was_full = self.pushed - self.popped + 1 == self.capacity
+        if self.capacity is not None and was_full:
+            with self.not_full:
+                self.not_full.notify()
+        return data
+
+    def is_empty(self) -> bool:
+        return self.head.next is None
+
+    def length(self) -> int:
+        if self.capacity is not None:
+            return self.pushed - self.popped
+        return sum(1 for _ in self)
+
+    def __len__(self) -> int:
+        return self.length()
+
+    def __iter__(self):
+        # Snapshot of the values, taken with both ends held.
+        with self.tail_lock, self.head_lock:
+            values = []
+            current = self.head.next
+            while current:
+                values.append(current.data)
+                current = current.next
+        return iter(values)
+
+    def __str__(self) -> str:
+        values = list(self)
+        if not values:
+            return "List is empty."
+        return " -> ".join(map(str, values)) + " -> HEAD"
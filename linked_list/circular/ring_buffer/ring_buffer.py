@@ -0,0 +1,212 @@
+from itertools import islice
+
+INITIAL_CAPACITY = 8
+
+class RingBuffer:
+    # Circular sequence in a preallocated list with the CircularDoublyLinkedList
+    # interface. Element i lives in slot (start + i) % capacity; the buffer
+    # doubles when full, so appending or prepending allocates no nodes.
+    def __init__(self, capacity: int = INITIAL_CAPACITY):
+        self.buffer: list = [None] * max(capacity, 1)
+        self.start: int = 0
+        self.size: int = 0
+
+    @classmethod
+    def from_iterable(cls, iterable) -> 'RingBuffer':
+        ring = cls()
+        ring.extend(iterable)
+        return ring
+
+    def is_empty(self) -> bool:
+        return self.size == 0
+
+    def _slot(self, pos: int) -> int:
+        return (self.start + pos) % len(self.buffer)
+
+    def _reserve(self, extra: int) -> None:
+        capacity = len(self.buffer)
+        if self.size + extra <= capacity:
+            return
+        while capacity < self.size + extra:
+            capacity *= 2
+        values = list(self)
+        self.buffer = values + [None] * (capacity - len(values))
+        self.start = 0
+
+    def _find(self, key: int):
+        # Position of the first key, searching each contiguous run of slots
+        # with list.index.
+        capacity = len(self.buffer)
+        end = self.start + self.size
+        try:
+            return self.buffer.index(key, self.start, min(end, capacity)) - self.start
+        except ValueError:
+            pass
+        if end > capacity:
+            try:
+                return self.buffer.index(key, 0, end - capacity) + capacity - self.start
+            except ValueError:
+                pass
+        return None
+
+    def _insert_at(self, pos: int, data: int) -> None:
+        # Shift whichever side of pos is shorter by one slot.
+        self._reserve(1)
+        buffer, slot = self.buffer, self._slot
+        if pos < self.size - pos:
+            self.start = (self.start - 1) % len(buffer)
+            for i in range(pos):
+                buffer[slot(i)] = buffer[slot(i + 1)]
+        else:
+            for i in range(self.size, pos, -1):
+                buffer[slot(i)] = buffer[slot(i - 1)]
+        buffer[slot(pos)] = data
+        self.size += 1
+
+    def _remove_at(self, pos: int) -> int:
+        buffer, slot = self.buffer, self._slot
+        data = buffer[slot(pos)]
+        if pos < self.size - pos - 1:
+            for i in range(pos, 0, -1):
+                buffer[slot(i)] = buffer[slot(i - 1)]
+            buffer[self.start] = None
+            self.start = (self.start + 1) % len(buffer)
+        else:
+            for i in range(pos, self.size - 1):
+                buffer[slot(i)] = buffer[slot(i + 1)]
+            buffer[slot(self.size - 1)] = None
+        self.size -= 1
+        return data
+
+    def append(self, data: int) -> None:
+        self._reserve(1)
+        self.buffer[self._slot(self.size)] = data
+        self.size += 1
+
+    def extend(self, iterable) -> None:
+        values = list(iterable)
+        self._reserve(len(values))
+        for data in values:
+            self.buffer[self._slot(self.size)] = data
+            self.size += 1
+
+    def extendleft(self, iterable) -> None:
+        values = list(iterable)
+        self._reserve(len(values))
+        for data in values:
+            self.start = (self.start - 1) % len(self.buffer)
+            self.buffer[self.start] = data
+            self.size += 1
+
+    def prepend(self, data: int) -> None:
+        self._reserve(1)
+        self.start = (self.start - 1) % len(self.buffer)
+        self.buffer[self.start] = data
+        self.size += 1
+
+    def delete(self, key: int) -> bool:
+        pos = self._find(key)
+        if pos is None:
+            return False
+        self._remove_at(pos)
+        return True
+
+    def delete_all(self, key: int) -> int:
+        values = [data for data in self if data != key]
+        removed = self.size - len(values)
+        if removed:
+            self.buffer = values + [None] * (len(self.buffer) - len(values))
+            self.start = 0
+            self.size = len(values)
+        return removed
+
+    def clear(self) -> None:
+        self.buffer = [None] * INITIAL_CAPACITY
+        self.start = self.size = 0
+
+    def insert_at(self, pos: int, data: int) -> None:
+        if pos < 0 or pos > self.size:
+            raise IndexError("position out of range")
+        self._insert_at(pos, data)
+
+    def delete_at(self, pos: int) -> int:
+        if pos < 0 or pos >= self.size:
+            raise IndexError("position out of range")
+        return self._remove_at(pos)
+
+    def rotate(self, k: int = 1) -> None:
+        # Move the head k elements forward (backward for negative k). A full
+        # buffer only moves start; otherwise the shorter end is moved across.
+        if self.is_empty():
+            return
+        k %= self.size
+        buffer = self.buffer
+        if self.size == len(buffer):
+            self.start = self._slot(k)
+        elif k <= self.size - k:
+            for _ in range(k):
+                buffer[self._slot(self.size)] = buffer[self.start]
+                buffer[self.start] = None
+                self.start = (self.start + 1) % len(buffer)
+        else:
+            for _ in range(self.size - k):
+                self.start = (self.start - 1) % len(buffer)
+                buffer[self.start] = buffer[self._slot(self.size)]
+                buffer[self._slot(self.size)] = None
+
+    def splice(self, other: 'RingBuffer') -> None:
+        # Move all of other's elements to the end of this ring; other is left
+        # empty. Unlike the node rings this copies, so it is O(len(other)).
+        if other is self:
+            raise ValueError("cannot splice a list into itself")
+        self.extend(other)
+        other.clear()
+
+    def eliminate_every(self, k: int):
+        # Josephus elimination: counting from the head, remove every k-th
+        # element until the ring is empty, yielding each removed value in turn.
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        return self._eliminate(k)
+
+    def _eliminate(self, k: int):
+        pos = 0
+        while not self.is_empty():
+            pos = (pos + k - 1) % self.size
+            yield self._remove_at(pos)
+
+    def display(self) -> None:
+        if self.is_empty():
+            print("List is empty.")
+            return
+        print(" <-> ".join(map(str, self)) + " <-> HEAD")
+
+    def search(self, key: int) -> bool:
+        return self._find(key) is not None
+
+    def length(self) -> int:
+        return self.size
+
+    def insert_after(self, prev_data: int, new_data: int) -> bool:
+        pos = self._find(prev_data)
+        if pos is None:
+            return False
+        self._insert_at(pos + 1, new_data)
+        return True
+
+    def view(self, start: int = 0, stop: int = None, step: int = 1):
+        # Lazily reads the values at positions islice would pick, straight
+        # from their slots, so no copy of the ring is made.
+        return (self.buffer[self._slot(pos)] for pos in islice(range(self.size), start, stop, step))
+
+    def __iter__(self):
+        end = self.start + self.size
+        capacity = len(self.buffer)
+        yield from self.buffer[self.start:min(end, capacity)]
+        if end > capacity:
+            yield from self.buffer[:end - capacity]
+
+    def __str__(self) -> str:
+        if self.is_empty():
+            return "List is empty."
+        return " <-> ".join(map(str, self)) + " <-> HEAD"
@@ -0,0 +1,43 @@
+import random
+import time
+import tracemalloc
+
+from linked_list_doubly import DoublyLinkedList
+from unrolled_linked_list import UnrolledDoublyLinkedList
+
+SIZES = [10_000, 100_000, 1_000_000]
+OPERATIONS = 200
+
+def timed(action):
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+def built_size(cls, values):
+    tracemalloc.start()
+    linked_list = cls.from_iterable(values)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return linked_list, size
+
+def random_edits(linked_list, size, operations, seed):
+    rng = random.Random(seed)
+    for _ in range(operations):
+        linked_list.insert_at_position(0, rng.randrange(size + 1))
+        linked_list.delete_at_position(rng.randrange(size + 1))
+
+def main():
+    print(f"{'size':>10} {'structure':>26} {'MiB':>8} {'iterate (s)':>12} {'search (s)':>11} {'edits/s':>10}")
+    for size in SIZES:
+        # Values above the small-int cache, as a real data set would have.
+        values = [1000 + i % 1000 for i in range(size)]
+        for cls in (DoublyLinkedList, UnrolledDoublyLinkedList):
+            linked_list, memory = built_size(cls, values)
+            iterate = timed(lambda: sum(linked_list))
+            search = timed(lambda: linked_list.search(-1))
+            edits = timed(lambda: random_edits(linked_list, size, OPERATIONS, seed=size))
+            print(f"{size:>10} {cls.__name__:>26} {memory / 2 ** 20:>8.1f} "
+                  f"{iterate:>12.4f} {search:>11.4f} {2 * OPERATIONS / edits:>10.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,102 @@
+import os
+import sys
 import tkinter as tk
 from tkinter import messagebox
-from tkinter import filedialog
-import time
+from itertools import islice
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'singly'))
+
+from skip_list import SkipListSequence
+from implicit_treap import ImplicitTreapSequence
+from list_visualizer import ListVisualizerMixin
+
+TRAVERSE_PREVIEW = 200
+# Default pause after each search match, in milliseconds
+SEARCH_DELAY_MS = 1000
+# Nodes one search animation step scans before yielding to the event loop
+SEARCH_SCAN_STEP = 5000
 
 class DoublyNode:
+    __slots__ = ('data', 'next', 'prev')
+
     def __init__(self, data):
         self.data = data
         self.next = None
         self.prev = None
 
 class DoublyLinkedList:
-    def __init__(self):
+    def __init__(self, indexed=False):
         self.head = None
         self.tail = None
+        self.size = 0
+        # Last positionally accessed (index, node), or None once an edit
+        # may have shifted it.
+        self.finger = None
+        # Optional value -> {node: None} map so value lookups skip the scan.
+        # A duplicated value is still scanned for: the map cannot tell which
+        # of its nodes comes first.
+        self.index = {} if indexed else None
+
+    def _index_add(self, node):
+        if self.index is not None:
+            self.index.setdefault(node.data, {})[node] = None
+
+    def _index_discard(self, node):
+        if self.index is not None:
+            nodes = self.index[node.data]
+            del nodes[node]
+            if not nodes:
+                del self.index[node.data]
+
+    def _find(self, data):
+        if self.index is not None:
+            nodes = self.index.get(data)
+            if not nodes:
+                return None
+            if len(nodes) == 1:
+                return next(iter(nodes))
+        current = self.head
+        while current:
+            if current.data == data:
+                return current
+            current = current.next
+        return None
+
+    def _unlink(self, node):
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        node.prev = node.next = None
+        self._index_discard(node)
+        self.size -= 1
+        self.finger = None
+
+    def _node_at(self, pos):
+        # Walk from whichever of head, tail and the finger is nearest to pos
+        # (0 <= pos < size), and leave the finger on the node found.
+        index, current = 0, self.head
+        if self.size - 1 - pos < pos:
+            index, current = self.size - 1, self.tail
+        if self.finger is not None and abs(self.finger[0] - pos) < abs(index - pos):
+            index, current = self.finger
+        while index < pos:
+            current = current.next
+            index += 1
+        while index > pos:
+            current = current.prev
+            index -= 1
+        self.finger = (pos, current)
+        return current
 
     def append(self, data):
         new_node = DoublyNode(data)
+        self._index_add(new_node)
+        self.size += 1
         if self.head is None:
             self.head = self.tail = new_node
             return
@@ -23,8 +104,77 @@ class DoublyLinkedList:
         self.tail.next = new_node
         self.tail = new_node
 
+    @classmethod
+    def from_iterable(cls, iterable, indexed=False):
+        linked_list = cls(indexed=indexed)
+        linked_list.extend(iterable)
+        return linked_list
+
+    @staticmethod
+    def _link_chain(iterable):
+        dummy = DoublyNode(None)
+        tail = dummy
+        count = 0
+        for data in iterable:
+            new_node = DoublyNode(data)
+            new_node.prev = tail
+            tail.next = tail = new_node
+            count += 1
+        head = dummy.next
+        if head is not None:
+            head.prev = None
+        return head, tail, count
+
+    def _index_chain(self, head):
+        if self.index is not None:
+            while head:
+                self._index_add(head)
+                head = head.next
+
+    def extend(self, iterable):
+        head, tail, count = self._link_chain(iterable)
+        if head is None:
+            return
+        self._index_chain(head)
+        self.size += count
+        if self.head is None:
+            self.head = head
+        else:
+            self.tail.next = head
+            head.prev = self.tail
+        self.tail = tail
+
+    def extendleft(self, iterable):
+        head = tail = None
+        count = 0
+        for data in iterable:
+            new_node = DoublyNode(data)
+            new_node.next = head
+            if head is not None:
+                head.prev = new_node
+            head = new_node
+            if tail is None:
+                tail = new_node
+            count += 1
+        if head is None:
+            return
+        self._index_chain(head)
+        self.size += count
+        if self.finger is not None:
+            self.finger = (self.finger[0] + count, self.finger[1])
+        if self.head is None:
+            self.tail = tail
+        else:
+            tail.next = self.head
+            self.head.prev = tail
+        self.head = head
+
     def insert_at_beginning(self, data):
         new_node = DoublyNode(data)
+        self._index_add(new_node)
+        self.size += 1
+        if self.finger is not None:
+            self.finger = (self.finger[0] + 1, self.finger[1])
         if self.head is None:
             self.head = self.tail = new_node
             return
@@ -32,18 +182,11 @@ class DoublyLinkedList:
         self.head.prev = new_node
         self.head = new_node
 
-    def insert_at_position(self, data, pos):
-        if pos == 0:
-            self.insert_at_beginning(data)
-            return
+    def _insert_after_node(self, current, data):
         new_node = DoublyNode(data)
-        current = self.head
-        for _ in range(pos - 1):
-            if current is None:
-                return
-            current = current.next
-        if current is None:
-            return
+        self._index_add(new_node)
+        self.size += 1
+        self.finger = None
         new_node.next = current.next
         new_node.prev = current
         if current.next:
@@ -52,60 +195,106 @@ class DoublyLinkedList:
         if new_node.next is None:
             self.tail = new_node
 
+    def insert_at_position(self, data, pos):
+        if pos == 0:
+            self.insert_at_beginning(data)
+            self.finger = (0, self.head)
+            return
+        if pos < 0 or pos > self.size:
+            return
+        current = self._node_at(pos - 1)
+        self._insert_after_node(current, data)
+        self.finger = (pos, current.next)
+
+    def insert_after(self, prev_data, data):
+        current = self._find(prev_data)
+        if current is None:
+            return False
+        self._insert_after_node(current, data)
+        return True
+
     def delete(self, data):
+        current = self._find(data)
+        if current is not None:
+            self._unlink(current)
+
+    def delete_all(self, data):
+        if self.index is not None:
+            nodes = list(self.index.get(data, ()))
+            for node in nodes:
+                self._unlink(node)
+            return len(nodes)
+        removed = 0
         current = self.head
         while current:
+            next_node = current.next
             if current.data == data:
-                if current.prev:
-                    current.prev.next = current.next
-                if current.next:
-                    current.next.prev = current.prev
-                if current == self.head:
-                    self.head = current.next
-                if current == self.tail:
-                    self.tail = current.prev
-                return
-            current = current.next
+                self._unlink(current)
+                removed += 1
+            current = next_node
+        return removed
+
+    def apply_batch(self, ops):
+        # ops is a list of (op, position, value) with op 'insert' or 'delete'.
+        # Positions refer to the list as it was before the batch, so the ops
+        # are applied in position order during a single forward walk. A
+        # delete only happens if value is None or matches the node's data.
+        # Returns one bool per op, in the order given.
+        results = [False] * len(ops)
+        prev = None
+        pos = 0
+        deleted = False
+        for i in sorted(range(len(ops)), key=lambda i: ops[i][1]):
+            op, target, value = ops[i]
+            if op not in ('insert', 'delete'):
+                raise ValueError(f"Unknown batch operation {op!r}")
+            if target < 0:
+                continue
+            while pos < target:
+                if not deleted:
+                    node = self.head if prev is None else prev.next
+                    if node is None:
+                        break
+                    prev = node
+                pos += 1
+                deleted = False
+            if pos < target:
+                continue
+            if op == 'insert':
+                if prev is None:
+                    self.insert_at_beginning(value)
+                    prev = self.head
+                else:
+                    self._insert_after_node(prev, value)
+                    prev = prev.next
+                results[i] = True
+            elif not deleted:
+                node = self.head if prev is None else prev.next
+                if node is not None and (value is None or node.data == value):
+                    self._unlink(node)
+                    deleted = True
+                    results[i] = True
+        return results
 
     def delete_from_beginning(self):
-        if self.head is None:
-            return
-        if self.head == self.tail:
-            self.head = self.tail = None
-            return
-        self.head = self.head.next
-        self.head.prev = None
+        if self.head is not None:
+            self._unlink(self.head)
 
     def delete_from_end(self):
-        if self.tail is None:
-            return
-        if self.head == self.tail:
-            self.head = self.tail = None
-            return
-        self.tail = self.tail.prev
-        self.tail.next = None
+        if self.tail is not None:
+            self._unlink(self.tail)
 
     def delete_at_position(self, pos):
-        if self.head is None:
-            return
-        if pos == 0:
-            self.delete_from_beginning()
-            return
-        current = self.head
-        for _ in range(pos):
-            if current is None:
-                return
-            current = current.next
-        if current is None:
+        if pos < 0 or pos >= self.size:
             return
-        if current.prev:
-            current.prev.next = current.next
-        if current.next:
-            current.next.prev = current.prev
-        if current == self.tail:
-            self.tail = current.prev
-        if current == self.head:
-            self.head = current.next    
+        current = self._node_at(pos)
+        before, after = current.prev, current.next
+        self._unlink(current)
+        # Keep the finger next to the gap so the next nearby edit is cheap.
+        if after is not None:
+            self.finger = (pos, after)
+        elif before is not None:
+            self.finger = (pos - 1, before)
 
     def traverse(self):
         elements = []
@@ -115,23 +304,32 @@ class DoublyLinkedList:
             current = current.next
         return elements
 
-    def search(self, data):
+    def __iter__(self):
         current = self.head
         while current:
-            if current.data == data:
-                return True
+            yield current.data
             current = current.next
-        return False
 
-    def length(self):
-        count = 0
-        current = self.head
+    def __reversed__(self):
+        current = self.tail
         while current:
-            count += 1
-            current = current.next
-        return count
+            yield current.data
+            current = current.prev
+
+    def __len__(self):
+        return self.size
+
+    def view(self, start=0, stop=None, step=1):
+        return islice(self, start, stop, step)
+
+    def search(self, data):
+        return self._find(data) is not None
+
+    def length(self):
+        return self.size
 
     def reverse(self):
+        self.finger = None
         current = self.head
         prev = None
         while current:
@@ -142,60 +340,90 @@ class DoublyLinkedList:
             current = next_node
         self.head, self.tail = self.tail, self.head
 
-    def merge_sort(self):
+    def merge_sort(self, key=None, reverse=False):
         if self.head is None or self.head.next is None:
             return
-
-        def split(head):
-            fast = head
-            slow = head
-            while fast.next and fast.next.next:
-                fast = fast.next.next
-                slow = slow.next
-            middle = slow.next
-            slow.next = None
-            return head, middle
-
-        def merge(left, right):
-            dummy = DoublyNode(0)
+        self.finger = None
+
+        # precedes(a, b) is true only when a must come strictly before b,
+        # which keeps equal elements in their original order.
+        if key is None:
+            if reverse:
+                precedes = lambda a, b: a.data > b.data
+            else:
+                precedes = lambda a, b: a.data < b.data
+        elif reverse:
+            precedes = lambda a, b: key(a.data) > key(b.data)
+        else:
+            precedes = lambda a, b: key(a.data) < key(b.data)
+
+        def merge(left_run, right_run):
+            left, left_tail = left_run
+            right, right_tail = right_run
+            dummy = DoublyNode(None)
             tail = dummy
             while left and right:
-                if left.data < right.data:
-                    tail.next = left
-                    left.prev = tail
-                    left = left.next
+                if precedes(right, left):
+                    tail.next, right = right, right.next
                 else:
-                    tail.next = right
-                    right.prev = tail
-                    right = right.next
-                tail = tail.next
-            tail.next = left or right
-            if tail.next:
+                    tail.next, left = left, left.next
                 tail.next.prev = tail
-            return dummy.next
-
-        def merge_sort_rec(head):
-            if head is None or head.next is None:
-                return head
-            left, right = split(head)
-            left = merge_sort_rec(left)
-            right = merge_sort_rec(right)
-            return merge(left, right)
-
-        self.head = merge_sort_rec(self.head)
-        self.tail = self.head
-        while self.tail and self.tail.next:
-            self.tail = self.tail.next
-
-class DoublyLinkedListVisualizer(tk.Tk):
-    def __init__(self):
+                tail = tail.next
+            if left:
+                tail.next, left.prev = left, tail
+                last = left_tail
+            else:
+                tail.next, right.prev = right, tail
+                last = right_tail
+            head = dummy.next
+            head.prev = None
+            return head, last
+
+        # Cut the list into its existing ascending runs.
+        runs = []
+        run_head = current = self.head
+        while current.next:
+            if precedes(current.next, current):
+                next_head = current.next
+                current.next = None
+                runs.append((run_head, current))
+                run_head = current = next_head
+            else:
+                current = current.next
+        runs.append((run_head, current))
+
+        while len(runs) > 1:
+            merged = [merge(runs[i], runs[i + 1]) for i in range(0, len(runs) - 1, 2)]
+            if len(runs) % 2:
+                merged.append(runs[-1])
+            runs = merged
+
+        self.head, self.tail = runs[0]
+
+class DoublyLinkedListVisualizer(ListVisualizerMixin, tk.Tk):
+    LINK_ARROW = tk.BOTH
+    BACKWARD_LINKS = True
+
+    def __init__(self, use_skip_list=False, use_treap=False):
         super().__init__()
         self.title("Doubly Linked List Visualizer")
         self.geometry("800x600")
-        self.canvas = tk.Canvas(self, width=800, height=350, bg='white')
-        self.canvas.pack(pady=20)
-        self.linked_list = DoublyLinkedList()
-        self.node_positions = {}
+        self.create_canvas()
+        if use_skip_list:
+            self.list_class = SkipListSequence
+        elif use_treap:
+            self.list_class = ImplicitTreapSequence
+        else:
+            self.list_class = DoublyLinkedList
+        self.linked_list = self.list_class()
+        self.create_scheduler()
+        self.create_load_controls()
+        # Matched nodes stay highlighted until the list changes or a new
+        # search starts; search_state is (value, node iterator, nodes
+        # scanned, matches so far) while an animated search is running.
+        self.search_hits = set()
+        self.search_state = None
+        self.search_job = None
         self.create_controls()
         self.update_visualization()
 
@@ -255,14 +483,26 @@ class DoublyLinkedListVisualizer(tk.Tk):
         load_button = tk.Button(control_frame, text="Load List", command=self.load_list, width=button_width, height=button_height)
         load_button.grid(row=3, column=3, padx=5)
 
+        goto_button = tk.Button(control_frame, text="Go to Position", command=self.go_to_position, width=button_width, height=button_height)
+        goto_button.grid(row=0, column=4, padx=5)
+
+        fast_search_button = tk.Button(control_frame, text="Fast Search", command=self.fast_search, width=button_width, height=button_height)
+        fast_search_button.grid(row=1, column=4, padx=5)
+
+        cancel_search_button = tk.Button(control_frame, text="Cancel Search", command=self.cancel_search, width=button_width, height=button_height)
+        cancel_search_button.grid(row=2, column=4, padx=5)
+
+        self.search_delay = tk.Scale(control_frame, from_=0, to=2000, resolution=50, orient=tk.HORIZONTAL, label="Search delay (ms)")
+        self.search_delay.set(SEARCH_DELAY_MS)
+        self.search_delay.grid(row=3, column=4, padx=5)
+
     def add_node(self):
         try:
             data = int(self.entry.get())
         except ValueError:
             messagebox.showerror("Invalid input", "Please enter an integer value.")
             return
-        self.linked_list.append(data)
-        self.update_visualization()
+        self.queue_operation(lambda: self.linked_list.append(data))
 
     def delete_node(self):
         try:
@@ -270,8 +510,7 @@ class DoublyLinkedListVisualizer(tk.Tk):
         except ValueError:
             messagebox.showerror("Invalid input", "Please enter an integer value.")
             return
-        self.linked_list.delete(data)
-        self.update_visualization()
+        self.queue_operation(lambda: self.linked_list.delete(data))
 
     def insert_at_beginning(self):
         try:
@@ -279,8 +518,7 @@ class DoublyLinkedListVisualizer(tk.Tk):
         except ValueError:
             messagebox.showerror("Invalid input", "Please enter an integer value.")
             return
-        self.linked_list.insert_at_beginning(data)
-        self.update_visualization()
+        self.queue_operation(lambda: self.linked_list.insert_at_beginning(data))
 
     def insert_at_position(self):
         try:
@@ -289,16 +527,13 @@ class DoublyLinkedListVisualizer(tk.Tk):
         except ValueError:
             messagebox.showerror("Invalid input", "Please enter the data and position as integers.")
             return
-        self.linked_list.insert_at_position(data, pos)
-        self.update_visualization()
+        self.queue_operation(lambda: self.linked_list.insert_at_position(data, pos))
 
     def delete_from_beginning(self):
-        self.linked_list.delete_from_beginning()
-        self.update_visualization()
+        self.queue_operation(lambda: self.linked_list.delete_from_beginning())
 
     def delete_from_end(self):
-        self.linked_list.delete_from_end()
-        self.update_visualization()
+        self.queue_operation(lambda: self.linked_list.delete_from_end())
 
     def delete_at_position(self):
         try:
@@ -309,110 +544,107 @@ class DoublyLinkedListVisualizer(tk.Tk):
         if pos < 0:
             messagebox.showerror("Invalid position", "Position must be a non-negative integer.")
             return
-        self.linked_list.delete_at_position(pos)
-        self.update_visualization()
+        self.queue_operation(lambda: self.linked_list.delete_at_position(pos))
 
     def search_node(self):
+        # Animated search: each step runs from the event loop via after(),
+        # highlights one match and waits for the delay slider before the
+        # next, so the window stays responsive and the search can be
+        # cancelled or sped up while it runs.
+        self.drain_operations()
         try:
             data = int(self.entry.get())
         except ValueError:
             messagebox.showerror("Invalid input", "Please enter an integer value.")
             return
-        current = self.linked_list.head
-        found = False
-        while current:
-            x, y = self.node_positions[current]
+        self.reset_search()
+        self.render_window()
+        self.search_state = (data, self.nodes_from(0), 0, 0)
+        self.search_job = self.after_idle(self.search_step)
+
+    def search_step(self):
+        data, nodes, index, found = self.search_state
+        match = None
+        for current in islice(nodes, SEARCH_SCAN_STEP):
+            index += 1
             if current.data == data:
-                self.canvas.create_oval(x-20, y-20, x+20, y+20, fill="green")
-                self.canvas.create_text(x, y, text=str(current.data))
-                self.update()
-                time.sleep(1)
-                found = True
-            current = current.next
-        if not found:
+                match = current
+                break
+        else:
+            if index == self.linked_list.length():
+                self.search_state = self.search_job = None
+                if not found:
+                    messagebox.showinfo("Search Result", f"Node with data {data} not found in the list.")
+                return
+        if match is None:
+            # A long run without a match; let the event loop in and go on.
+            self.search_state = (data, nodes, index, found)
+            self.search_job = self.after(1, self.search_step)
+            return
+        self.search_hits.add(match)
+        if match in self.node_positions:
+            self.draw_highlight(match)
+        else:
+            self.scroll_to(index - 1)
+        self.search_state = (data, nodes, index, found + 1)
+        self.search_job = self.after(self.search_delay.get(), self.search_step)
+
+    def fast_search(self):
+        # Collect every match in one pass and highlight them in one redraw.
+        self.drain_operations()
+        try:
+            data = int(self.entry.get())
+        except ValueError:
+            messagebox.showerror("Invalid input", "Please enter an integer value.")
+            return
+        self.reset_search()
+        for current in self.nodes_from(0):
+            if current.data == data:
+                self.search_hits.add(current)
+        self.render_window()
+        if not self.search_hits:
             messagebox.showinfo("Search Result", f"Node with data {data} not found in the list.")
-        self.update_visualization()
+
+    def cancel_search(self):
+        if self.search_job is not None:
+            self.after_cancel(self.search_job)
+        self.search_state = self.search_job = None
+
+    def reset_search(self):
+        self.cancel_search()
+        self.search_hits.clear()
+
+    def list_changed(self):
+        # Search results refer to the list as it is now, so drop them.
+        self.reset_search()
+
+    def node_rendered(self, node):
+        if node in self.search_hits:
+            self.draw_highlight(node)
+
+    def draw_highlight(self, node):
+        x, y = self.node_positions[node]
+        self.canvas.create_oval(x-20, y-20, x+20, y+20, fill="green", tags="highlight")
+        self.canvas.create_text(x, y, text=str(node.data), tags="highlight")
 
     def get_length(self):
+        self.run_pending()
         length = self.linked_list.length()
         messagebox.showinfo("List Length", f"The length of the list is {length}.")
 
     def traverse_list(self):
-        elements = self.linked_list.traverse()
-        messagebox.showinfo("Traversal Result", f"The elements in the list are: {elements}")
+        self.drain_operations()
+        elements = list(self.linked_list.view(0, TRAVERSE_PREVIEW))
+        remaining = self.linked_list.length() - len(elements)
+        more = f" ... and {remaining} more" if remaining > 0 else ""
+        messagebox.showinfo("Traversal Result", f"The elements in the list are: {elements}{more}")
 
     def reverse_list(self):
-        self.linked_list.reverse()
-        self.update_visualization()
+        self.queue_operation(lambda: self.linked_list.reverse())
 
     def sort_list(self):
-        self.linked_list.merge_sort()
-        self.update_visualization()
-
-    def update_visualization(self):
-        self.canvas.delete("all")
-        current = self.linked_list.head
-        x, y = 50, 200
-        self.node_positions.clear()
-
-        while current:
-            self.node_positions[current] = (x, y)
-            self.canvas.create_oval(x-20, y-20, x+20, y+20, fill="lightblue")
-            self.canvas.create_text(x, y, text=str(current.data))
-            
-            if current is self.linked_list.head:
-                self.canvas.create_text(x-30, y-30, text="Head", anchor=tk.CENTER, font=("Arial", 10, "bold"))
-            if current.next is None:
-                self.canvas.create_text(x+30, y-30, text="Tail", anchor=tk.CENTER, font=("Arial", 10, "bold"))
-            
-            # Only draw prev arrow if not head node
-            if current.prev and current is not self.linked_list.head:
-                self.canvas.create_line(x-60, y, x-20, y, arrow=tk.BOTH)
-            if current.next:
-                self.canvas.create_line(x+20, y, x+60, y, arrow=tk.BOTH)
-            
-            x += 80
-            current = current.next
-
-    """        
-    def update_visualization(self):
-        self.canvas.delete("all")
-        current = self.linked_list.head
-        x, y = 50, 200
-        self.node_positions.clear()
-        while current:
-            self.node_positions[current] = (x, y)
-            self.canvas.create_oval(x-20, y-20, x+20, y+20, fill="lightblue")
-            self.canvas.create_text(x, y, text=str(current.data))
-            if current is self.linked_list.head:
-                self.canvas.create_text(x-30, y-30, text="Head", anchor=tk.CENTER, font=("Arial", 10, "bold"))
-            if current.next is None:
-                self.canvas.create_text(x+30, y-30, text="Tail", anchor=tk.CENTER, font=("Arial", 10, "bold"))
-            if current.next:
-                self.canvas.create_line(x+20, y, x+80-20, y, arrow=tk.LAST)
-            x += 80
-            current = current.next
-    """
-    def save_list(self):
-        filename = filedialog.asksaveasfilename(defaultextension=".txt", filetypes=[("Text files", "*.txt")])
-        if filename:
-            with open(filename, 'w') as file:
-                current = self.linked_list.head
-                while current:
-                    file.write(str(current.data) + '\n')
-                    current = current.next
-            messagebox.showinfo("Save List", f"List saved to {filename}")
-
-    def load_list(self):
-        filename = filedialog.askopenfilename(filetypes=[("Text files", "*.txt")])
-        if filename:
-            self.linked_list = DoublyLinkedList()
-            with open(filename, 'r') as file:
-                for line in file:
-                    self.linked_list.append(int(line.strip()))
-            self.update_visualization()
-            messagebox.showinfo("Load List", f"List loaded from {filename}")
+        self.queue_operation(lambda: self.linked_list.merge_sort())
 
 if __name__ == "__main__":
-    app = DoublyLinkedListVisualizer()
+    app = DoublyLinkedListVisualizer(use_skip_list="--skip-list" in sys.argv, use_treap="--treap" in sys.argv)
     app.mainloop()
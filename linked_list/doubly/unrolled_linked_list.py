@@ -0,0 +1,308 @@
+from array import array
+from itertools import chain, islice
+
+# Values per block; a full block is split in half before it takes another.
+BLOCK_SIZE = 64
+
+class UnrolledNode:
+    __slots__ = ('values', 'next', 'prev')
+
+    def __init__(self, values):
+        self.values = values
+        self.next = None
+        self.prev = None
+
+# Doubly linked list of array('q') blocks with the DoublyLinkedList
+# interface. Walks touch one node per block instead of one per value, and
+# values are stored unboxed, so scans and positional walks are much
+# cheaper. Values must be integers that fit in 64 bits.
+class UnrolledDoublyLinkedList:
+    def __init__(self):
+        self.head = None
+        self.tail = None
+        self.size = 0
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        linked_list = cls()
+        linked_list.extend(iterable)
+        return linked_list
+
+    def _link_after(self, block, new_block):
+        new_block.prev = block
+        new_block.next = block.next
+        if block.next:
+            block.next.prev = new_block
+        else:
+            self.tail = new_block
+        block.next = new_block
+
+    def _unlink(self, block):
+        if block.prev:
+            block.prev.next = block.next
+        else:
+            self.head = block.next
+        if block.next:
+            block.next.prev = block.prev
+        else:
+            self.tail = block.prev
+        block.prev = block.next = None
+
+    @staticmethod
+    def _chain(values):
+        # Cut values into full blocks and link them; returns (head, tail).
+        head = tail = None
+        for start in range(0, len(values), BLOCK_SIZE):
+            block = UnrolledNode(values[start:start + BLOCK_SIZE])
+            if tail is None:
+                head = block
+            else:
+                tail.next = block
+                block.prev = tail
+            tail = block
+        return head, tail
+
+    def _locate(self, pos):
+        # (block, offset) of position pos (0 <= pos < size), walking block
+        # by block from the nearer end.
+        if pos < self.size - pos:
+            block = self.head
+            while pos >= len(block.values):
+                pos -= len(block.values)
+                block = block.next
+            return block, pos
+        remaining = self.size - pos
+        block = self.tail
+        while remaining > len(block.values):
+            remaining -= len(block.values)
+            block = block.prev
+        return block, len(block.values) - remaining
+
+    def _find(self, data):
+        block = self.head
+        while block:
+            if data in block.values:
+                return block, block.values.index(data)
+            block = block.next
+        return None, None
+
+    def _insert_in_block(self, block, offset, data):
+        if len(block.values) == BLOCK_SIZE:
+            half = BLOCK_SIZE // 2
+            self._link_after(block, UnrolledNode(block.values[half:]))
+            del block.values[half:]
+            if offset > half:
+                block = block.next
+                offset -= half
+        block.values.insert(offset, data)
+        self.size += 1
+
+    def _remove_in_block(self, block, offset):
+        del block.values[offset]
+        self.size -= 1
+        if not block.values:
+            self._unlink(block)
+        elif len(block.values) < BLOCK_SIZE // 2:
+            # Fold an underfull block into a neighbour that has room.
+            if block.next and len(block.values) + len(block.next.values) <= BLOCK_SIZE:
+                block.values.extend(block.next.values)
+                self._unlink(block.next)
+            elif block.prev and len(block.values) + len(block.prev.values) <= BLOCK_SIZE:
+                block.prev.values.extend(block.values)
+                self._unlink(block)
+
+    def append(self, data):
+        if self.tail is None or len(self.tail.values) == BLOCK_SIZE:
+            block = UnrolledNode(array('q'))
+            if self.tail is None:
+                self.head = self.tail = block
+            else:
+                self._link_after(self.tail, block)
+        self.tail.values.append(data)
+        self.size += 1
+
+    def extend(self, iterable):
+        values = array('q', iterable)
+        if not values:
+            return
+        self.size += len(values)
+        if self.tail is not None:
+            room = BLOCK_SIZE - len(self.tail.values)
+            self.tail.values.extend(values[:room])
+            values = values[room:]
+        head, tail = self._chain(values)
+        if head is None:
+            return
+        if self.tail is None:
+            self.head = head
+        else:
+            self.tail.next = head
+            head.prev = self.tail
+        self.tail = tail
+
+    def extendleft(self, iterable):
+        values = array('q', iterable)
+        if not values:
+            return
+        values.reverse()
+        self.size += len(values)
+        head, tail = self._chain(values)
+        if self.head is None:
+            self.tail = tail
+        else:
+            tail.next = self.head
+            self.head.prev = tail
+        self.head = head
+
+    def insert_at_beginning(self, data):
+        if self.head is None:
+            self.append(data)
+            return
+        self._insert_in_block(self.head, 0, data)
+
+    def insert_at_position(self, data, pos):
+        if pos < 0 or pos > self.size:
+            return
+        if pos == self.size:
+            self.append(data)
+            return
+        block, offset = self._locate(pos)
+        self._insert_in_block(block, offset, data)
+
+    def insert_after(self, prev_data, data):
+        block, offset = self._find(prev_data)
+        if block is None:
+            return False
+        self._insert_in_block(block, offset + 1, data)
+        return True
+
+    def delete(self, data):
+        block, offset = self._find(data)
+        if block is not None:
+            self._remove_in_block(block, offset)
+
+    def delete_all(self, data):
+        removed = 0
+        block = self.head
+        while block:
+            next_block = block.next
+            count = block.values.count(data)
+            if count:
+                block.values = array('q', (value for value in block.values if value != data))
+                removed += count
+                if not block.values:
+                    self._unlink(block)
+            block = next_block
+        self.size -= removed
+        return removed
+
+    def apply_batch(self, ops):
+        # Same contract as DoublyLinkedList.apply_batch: positions refer to
+        # the list before the batch, deletes only match value when it is not
+        # None, and one bool per op is returned. The result is built in one
+        # pass over the values and then re-blocked.
+        values = self.traverse()
+        result = array('q')
+        results = [False] * len(ops)
+        pos = 0
+        deleted = False
+        for i in sorted(range(len(ops)), key=lambda i: ops[i][1]):
+            op, target, value = ops[i]
+            if op not in ('insert', 'delete'):
+                raise ValueError(f"Unknown batch operation {op!r}")
+            if target < 0 or target > len(values):
+                continue
+            while pos < target:
+                if not deleted:
+                    result.append(values[pos])
+                pos += 1
+                deleted = False
+            if op == 'insert':
+                result.append(value)
+                results[i] = True
+            elif not deleted and pos < len(values) and (value is None or values[pos] == value):
+                deleted = True
+                results[i] = True
+        result.extend(values[pos + 1 if deleted else pos:])
+        self.clear_list()
+        self.extend(result)
+        return results
+
+    def delete_from_beginning(self):
+        if self.head is not None:
+            self._remove_in_block(self.head, 0)
+
+    def delete_from_end(self):
+        if self.tail is not None:
+            self._remove_in_block(self.tail, len(self.tail.values) - 1)
+
+    def delete_at_position(self, pos):
+        if pos < 0 or pos >= self.size:
+            return
+        block, offset = self._locate(pos)
+        self._remove_in_block(block, offset)
+
+    def traverse(self):
+        elements = []
+        block = self.head
+        while block:
+            elements.extend(block.values)
+            block = block.next
+        return elements
+
+    @staticmethod
+    def _blocks(block):
+        while block:
+            yield block.values
+            block = block.next
+
+    def _blocks_reversed(self):
+        block = self.tail
+        while block:
+            yield reversed(block.values)
+            block = block.prev
+
+    def __iter__(self):
+        # chain runs the per-value loop in C, so only blocks cost Python steps.
+        return chain.from_iterable(self._blocks(self.head))
+
+    def __reversed__(self):
+        return chain.from_iterable(self._blocks_reversed())
+
+    def __len__(self):
+        return self.size
+
+    def view(self, start=0, stop=None, step=1):
+        # Skip whole blocks to reach start, then iterate lazily from there.
+        if start >= self.size:
+            return iter(())
+        if stop is not None:
+            stop = max(stop - start, 0)
+        block, offset = self._locate(start)
+        values = chain(islice(block.values, offset, None), chain.from_iterable(self._blocks(block.next)))
+        return islice(values, 0, stop, step)
+
+    def search(self, data):
+        return self._find(data)[0] is not None
+
+    def length(self):
+        return self.size
+
+    def reverse(self):
+        block = self.head
+        while block:
+            block.values.reverse()
+            block.next, block.prev = block.prev, block.next
+            block = block.prev
+        self.head, self.tail = self.tail, self.head
+
+    def merge_sort(self, key=None, reverse=False):
+        # sorted() is a stable merge sort over the unboxed values; refilling
+        # the blocks from its result also packs them full again.
+        elements = sorted(self.traverse(), key=key, reverse=reverse)
+        self.clear_list()
+        self.extend(elements)
+
+    def clear_list(self):
+        self.head = self.tail = None
+        self.size = 0
@@ -0,0 +1,368 @@
+from array import array
+from itertools import islice
+
+NIL = -1
+
+# Struct-of-arrays node storage: node i lives at index i of each buffer.
+# Freed slots are chained through the next buffer and reused before the
+# buffers grow.
+class NodePool:
+    def __init__(self, doubly=False):
+        self.doubly = doubly
+        self.clear()
+
+    def clear(self):
+        self.data = array('q')
+        self.next = array('q')
+        self.prev = array('q') if self.doubly else None
+        self.free_head = NIL
+
+    def alloc(self, data):
+        idx = self.free_head
+        if idx != NIL:
+            self.free_head = self.next[idx]
+            self.data[idx] = data
+            self.next[idx] = NIL
+            if self.doubly:
+                self.prev[idx] = NIL
+            return idx
+        idx = len(self.data)
+        self.data.append(data)
+        self.next.append(NIL)
+        if self.doubly:
+            self.prev.append(NIL)
+        return idx
+
+    def free(self, idx):
+        self.next[idx] = self.free_head
+        self.free_head = idx
+
+
+class PooledLinkedList:
+    def __init__(self):
+        self.pool = NodePool()
+        self.head = NIL
+        self.tail = NIL
+        self.size = 0
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        linked_list = cls()
+        linked_list.extend(iterable)
+        return linked_list
+
+    def append(self, data):
+        idx = self.pool.alloc(data)
+        if self.head == NIL:
+            self.head = idx
+        else:
+            self.pool.next[self.tail] = idx
+        self.tail = idx
+        self.size += 1
+
+    def extend(self, iterable):
+        for data in iterable:
+            self.append(data)
+
+    def extendleft(self, iterable):
+        for data in iterable:
+            self.insert_at_beginning(data)
+
+    def insert_at_beginning(self, data):
+        idx = self.pool.alloc(data)
+        self.pool.next[idx] = self.head
+        self.head = idx
+        if self.tail == NIL:
+            self.tail = idx
+        self.size += 1
+
+    def insert_at_position(self, data, pos):
+        # NIL is -1, so a negative pos must not reach the index arrays.
+        if pos < 0 or pos > self.size:
+            return
+        if pos == 0:
+            self.insert_at_beginning(data)
+            return
+        if pos == self.size:
+            self.append(data)
+            return
+        nxt = self.pool.next
+        current = self.head
+        for _ in range(pos - 1):
+            current = nxt[current]
+        idx = self.pool.alloc(data)
+        nxt[idx] = nxt[current]
+        nxt[current] = idx
+        self.size += 1
+
+    def delete_at_position(self, data, pos):
+        if pos < 0 or pos >= self.size:
+            return False
+        if pos == 0:
+            self.delete_from_beginning()
+            return True
+        nxt = self.pool.next
+        prev = self.head
+        for _ in range(pos - 1):
+            prev = nxt[prev]
+        target = nxt[prev]
+        if self.pool.data[target] != data:
+            return False
+        nxt[prev] = nxt[target]
+        if target == self.tail:
+            self.tail = prev
+        self.pool.free(target)
+        self.size -= 1
+        return True
+
+    def delete_from_beginning(self):
+        if self.head == NIL:
+            return
+        old = self.head
+        self.head = self.pool.next[old]
+        if self.head == NIL:
+            self.tail = NIL
+        self.pool.free(old)
+        self.size -= 1
+
+    def delete_from_end(self):
+        if self.head == NIL:
+            return
+        if self.head == self.tail:
+            self.clear_list()
+            return
+        nxt = self.pool.next
+        second_last = self.head
+        while nxt[second_last] != self.tail:
+            second_last = nxt[second_last]
+        nxt[second_last] = NIL
+        self.pool.free(self.tail)
+        self.tail = second_last
+        self.size -= 1
+
+    def traverse(self):
+        data, nxt = self.pool.data, self.pool.next
+        elements = []
+        current = self.head
+        while current != NIL:
+            elements.append(data[current])
+            current = nxt[current]
+        return elements
+
+    def __iter__(self):
+        data, nxt = self.pool.data, self.pool.next
+        current = self.head
+        while current != NIL:
+            yield data[current]
+            current = nxt[current]
+
+    def __reversed__(self):
+        return reversed(self.traverse())
+
+    def __len__(self):
+        return self.size
+
+    def view(self, start=0, stop=None, step=1):
+        return islice(self, start, stop, step)
+
+    def search(self, data):
+        values, nxt = self.pool.data, self.pool.next
+        current = self.head
+        while current != NIL:
+            if values[current] == data:
+                return True
+            current = nxt[current]
+        return False
+
+    def length(self):
+        return self.size
+
+    def reverse(self):
+        nxt = self.pool.next
+        prev = NIL
+        current = self.head
+        self.tail = current
+        while current != NIL:
+            next_node = nxt[current]
+            nxt[current] = prev
+            prev = current
+            current = next_node
+        self.head = prev
+
+    def merge_sort(self, key=None, reverse=False):
+        # Values are plain integers, so sorting them in place along the
+        # existing chain is indistinguishable from relinking the nodes.
+        values, nxt = self.pool.data, self.pool.next
+        current = self.head
+        for value in sorted(self.traverse(), key=key, reverse=reverse):
+            values[current] = value
+            current = nxt[current]
+
+    def clear_list(self):
+        self.pool.clear()
+        self.head = self.tail = NIL
+        self.size = 0
+
+
+class PooledDoublyLinkedList:
+    def __init__(self):
+        self.pool = NodePool(doubly=True)
+        self.head = NIL
+        self.tail = NIL
+        self.size = 0
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        linked_list = cls()
+        linked_list.extend(iterable)
+        return linked_list
+
+    def append(self, data):
+        idx = self.pool.alloc(data)
+        if self.head == NIL:
+            self.head = idx
+        else:
+            self.pool.next[self.tail] = idx
+            self.pool.prev[idx] = self.tail
+        self.tail = idx
+        self.size += 1
+
+    def extend(self, iterable):
+        for data in iterable:
+            self.append(data)
+
+    def extendleft(self, iterable):
+        for data in iterable:
+            self.insert_at_beginning(data)
+
+    def insert_at_beginning(self, data):
+        idx = self.pool.alloc(data)
+        if self.head == NIL:
+            self.tail = idx
+        else:
+            self.pool.next[idx] = self.head
+            self.pool.prev[self.head] = idx
+        self.head = idx
+        self.size += 1
+
+    def insert_at_position(self, data, pos):
+        # NIL is -1, so a negative pos must not reach the index arrays.
+        if pos < 0 or pos > self.size:
+            return
+        if pos == 0:
+            self.insert_at_beginning(data)
+            return
+        if pos == self.size:
+            self.append(data)
+            return
+        nxt, prv = self.pool.next, self.pool.prev
+        current = self.head
+        for _ in range(pos - 1):
+            current = nxt[current]
+        idx = self.pool.alloc(data)
+        nxt[idx] = nxt[current]
+        prv[idx] = current
+        prv[nxt[current]] = idx
+        nxt[current] = idx
+        self.size += 1
+
+    def _unlink(self, idx):
+        nxt, prv = self.pool.next, self.pool.prev
+        before, after = prv[idx], nxt[idx]
+        if before == NIL:
+            self.head = after
+        else:
+            nxt[before] = after
+        if after == NIL:
+            self.tail = before
+        else:
+            prv[after] = before
+        self.pool.free(idx)
+        self.size -= 1
+
+    def delete(self, data):
+        values, nxt = self.pool.data, self.pool.next
+        current = self.head
+        while current != NIL:
+            if values[current] == data:
+                self._unlink(current)
+                return
+            current = nxt[current]
+
+    def delete_from_beginning(self):
+        if self.head != NIL:
+            self._unlink(self.head)
+
+    def delete_from_end(self):
+        if self.tail != NIL:
+            self._unlink(self.tail)
+
+    def delete_at_position(self, pos):
+        if pos < 0 or pos >= self.size:
+            return
+        nxt = self.pool.next
+        current = self.head
+        for _ in range(pos):
+            current = nxt[current]
+        self._unlink(current)
+
+    def traverse(self):
+        data, nxt = self.pool.data, self.pool.next
+        elements = []
+        current = self.head
+        while current != NIL:
+            elements.append(data[current])
+            current = nxt[current]
+        return elements
+
+    def __iter__(self):
+        data, nxt = self.pool.data, self.pool.next
+        current = self.head
+        while current != NIL:
+            yield data[current]
+            current = nxt[current]
+
+    def __reversed__(self):
+        data, prv = self.pool.data, self.pool.prev
+        current = self.tail
+        while current != NIL:
+            yield data[current]
+            current = prv[current]
+
+    def __len__(self):
+        return self.size
+
+    def view(self, start=0, stop=None, step=1):
+        return islice(self, start, stop, step)
+
+    def search(self, data):
+        values, nxt = self.pool.data, self.pool.next
+        current = self.head
+        while current != NIL:
+            if values[current] == data:
+                return True
+            current = nxt[current]
+        return False
+
+    def length(self):
+        return self.size
+
+    def reverse(self):
+        nxt, prv = self.pool.next, self.pool.prev
+        current = self.head
+        while current != NIL:
+            nxt[current], prv[current] = prv[current], nxt[current]
+            current = prv[current]
+        self.head, self.tail = self.tail, self.head
+
+    def merge_sort(self, key=None, reverse=False):
+        values, nxt = self.pool.data, self.pool.next
+        current = self.head
+        for value in sorted(self.traverse(), key=key, reverse=reverse):
+            values[current] = value
+            current = nxt[current]
+
+    def clear_list(self):
+        self.pool.clear()
+        self.head = self.tail = NIL
+        self.size = 0
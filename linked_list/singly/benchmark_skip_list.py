@@ -0,0 +1,42 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'doubly'))
+
+from linked_list_singly import LinkedList
+from linked_list_doubly import DoublyLinkedList
+from skip_list import SkipListSequence
+from implicit_treap import ImplicitTreapSequence
+
+SIZES = [10_000, 100_000, 1_000_000]
+OPERATIONS = 200
+
+def random_edits(linked_list, size, operations, seed):
+    # Every element is 0, so the singly-style delete_at_position(data, pos)
+    # always matches and each edit costs exactly one positional walk.
+    rng = random.Random(seed)
+    doubly = isinstance(linked_list, DoublyLinkedList)
+    start = time.perf_counter()
+    for _ in range(operations):
+        linked_list.insert_at_position(0, rng.randrange(size + 1))
+        pos = rng.randrange(size + 1)
+        if doubly:
+            linked_list.delete_at_position(pos)
+        else:
+            linked_list.delete_at_position(0, pos)
+    return time.perf_counter() - start
+
+def main():
+    print(f"{'size':>10} {'structure':>22} {'build (s)':>10} {'edits/s':>12}")
+    for size in SIZES:
+        for cls in (LinkedList, DoublyLinkedList, SkipListSequence, ImplicitTreapSequence):
+            start = time.perf_counter()
+            linked_list = cls.from_iterable([0] * size)
+            build = time.perf_counter() - start
+            elapsed = random_edits(linked_list, size, OPERATIONS, seed=size)
+            print(f"{size:>10} {cls.__name__:>22} {build:>10.3f} {2 * OPERATIONS / elapsed:>12.0f}")
+
+if __name__ == "__main__":
+    main()
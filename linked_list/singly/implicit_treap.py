@@ -0,0 +1,280 @@
+import random
+from itertools import islice
+
+class TreapNode:
+    __slots__ = ('data', 'priority', 'size', 'left', 'right', 'rev')
+
+    def __init__(self, data):
+        self.data = data
+        self.priority = random.random()
+        self.size = 1
+        self.left = None
+        self.right = None
+        # Pending reversal of this subtree, not yet applied to the children
+        self.rev = False
+
+def _size(node):
+    return node.size if node else 0
+
+def _push(node):
+    if node.rev:
+        node.left, node.right = node.right, node.left
+        if node.left:
+            node.left.rev = not node.left.rev
+        if node.right:
+            node.right.rev = not node.right.rev
+        node.rev = False
+
+def _update(node):
+    node.size = 1 + _size(node.left) + _size(node.right)
+
+def _split(node, k):
+    # Split into (first k elements, the rest).
+    if node is None:
+        return None, None
+    _push(node)
+    if _size(node.left) < k:
+        left, right = _split(node.right, k - _size(node.left) - 1)
+        node.right = left
+        _update(node)
+        return node, right
+    left, right = _split(node.left, k)
+    node.left = right
+    _update(node)
+    return left, node
+
+def _merge(left, right):
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        _push(left)
+        left.right = _merge(left.right, right)
+        _update(left)
+        return left
+    _push(right)
+    right.left = _merge(left, right.left)
+    _update(right)
+    return right
+
+def _build(iterable):
+    # Cartesian tree over random priorities in one left-to-right pass, with
+    # sizes filled in afterwards from the leaves up.
+    stack = []
+    for data in iterable:
+        node = TreapNode(data)
+        last = None
+        while stack and stack[-1].priority < node.priority:
+            last = stack.pop()
+        node.left = last
+        if stack:
+            stack[-1].right = node
+        stack.append(node)
+    if not stack:
+        return None
+    order = []
+    pending = [stack[0]]
+    while pending:
+        node = pending.pop()
+        order.append(node)
+        if node.left:
+            pending.append(node.left)
+        if node.right:
+            pending.append(node.right)
+    for node in reversed(order):
+        _update(node)
+    return stack[0]
+
+# Sequence with the LinkedList interface, backed by an implicit treap: a
+# node's position is the size of everything left of it, so positional
+# insert/delete, split, concat and range reversal all run in O(log n)
+# expected. Reversal is stored as a flag and pushed down lazily.
+class ImplicitTreapSequence:
+    def __init__(self):
+        self.root = None
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        sequence = cls()
+        sequence.root = _build(iterable)
+        return sequence
+
+    @property
+    def size(self):
+        return _size(self.root)
+
+    @property
+    def head(self):
+        return self.node_at(0) if self.root else None
+
+    @property
+    def tail(self):
+        return self.node_at(self.root.size - 1) if self.root else None
+
+    def node_at(self, pos):
+        if pos < 0 or pos >= self.size:
+            raise IndexError("position out of range")
+        node = self.root
+        while True:
+            _push(node)
+            left = _size(node.left)
+            if pos < left:
+                node = node.left
+            elif pos == left:
+                return node
+            else:
+                pos -= left + 1
+                node = node.right
+
+    def get(self, pos):
+        return self.node_at(pos).data
+
+    def __getitem__(self, pos):
+        if pos < 0:
+            pos += self.size
+        return self.get(pos)
+
+    def nodes_from(self, pos):
+        # In-order walk from position pos, pushing reversal flags down on
+        # the way so nodes come out in sequence order.
+        stack = []
+        node = self.root
+        while node:
+            _push(node)
+            left = _size(node.left)
+            if pos < left:
+                stack.append(node)
+                node = node.left
+            elif pos == left:
+                stack.append(node)
+                break
+            else:
+                pos -= left + 1
+                node = node.right
+        while stack:
+            node = stack.pop()
+            yield node
+            node = node.right
+            while node:
+                _push(node)
+                stack.append(node)
+                node = node.left
+
+    def insert_at_position(self, data, pos):
+        if pos < 0 or pos > self.size:
+            return
+        left, right = _split(self.root, pos)
+        self.root = _merge(_merge(left, TreapNode(data)), right)
+
+    def append(self, data):
+        self.root = _merge(self.root, TreapNode(data))
+
+    def insert_at_beginning(self, data):
+        self.root = _merge(TreapNode(data), self.root)
+
+    def insert_after(self, prev_data, data):
+        pos = self._index_of(prev_data)
+        if pos is None:
+            return False
+        self.insert_at_position(data, pos + 1)
+        return True
+
+    def extend(self, iterable):
+        self.root = _merge(self.root, _build(iterable))
+
+    def extendleft(self, iterable):
+        self.root = _merge(_build(reversed(list(iterable))), self.root)
+
+    def _delete(self, pos):
+        left, rest = _split(self.root, pos)
+        _, right = _split(rest, 1)
+        self.root = _merge(left, right)
+
+    def delete_at_position(self, *args):
+        # Takes (pos) like DoublyLinkedList or (data, pos) like LinkedList,
+        # so either visualizer can drive it. Given data, the node must hold
+        # it unless pos is 0, as in LinkedList.
+        pos = args[-1]
+        if pos < 0 or pos >= self.size:
+            return False
+        if len(args) == 2 and pos != 0 and self.node_at(pos).data != args[0]:
+            return False
+        self._delete(pos)
+        return True
+
+    def delete_from_beginning(self):
+        if self.root:
+            self._delete(0)
+
+    def delete_from_end(self):
+        if self.root:
+            self._delete(self.root.size - 1)
+
+    def delete(self, data):
+        pos = self._index_of(data)
+        if pos is not None:
+            self._delete(pos)
+
+    def _index_of(self, data):
+        for pos, node in enumerate(self.nodes_from(0)):
+            if node.data == data:
+                return pos
+        return None
+
+    def reverse(self, i=0, j=None):
+        # Reverse positions i..j-1 (the whole sequence by default) by
+        # flagging the middle piece.
+        size = self.size
+        i = max(i, 0)
+        j = size if j is None else min(j, size)
+        if j - i < 2:
+            return
+        left, rest = _split(self.root, i)
+        middle, right = _split(rest, j - i)
+        middle.rev = not middle.rev
+        self.root = _merge(_merge(left, middle), right)
+
+    def split(self, pos):
+        # Keep the first pos elements; the rest move to the returned sequence.
+        rest = type(self)()
+        self.root, rest.root = _split(self.root, max(pos, 0))
+        return rest
+
+    def concat(self, other):
+        # Move every element of other onto the end of this sequence.
+        if other is self:
+            raise ValueError("cannot concatenate a sequence with itself")
+        self.root = _merge(self.root, other.root)
+        other.root = None
+
+    def traverse(self):
+        return [node.data for node in self.nodes_from(0)]
+
+    def __iter__(self):
+        for node in self.nodes_from(0):
+            yield node.data
+
+    def __reversed__(self):
+        return reversed(self.traverse())
+
+    def __len__(self):
+        return self.size
+
+    def view(self, start=0, stop=None, step=1):
+        # Descend straight to start in O(log n), then walk in order lazily.
+        if stop is not None:
+            stop = max(stop - start, 0)
+        return islice((node.data for node in self.nodes_from(start)), 0, stop, step)
+
+    def search(self, data):
+        return self._index_of(data) is not None
+
+    def length(self):
+        return self.size
+
+    def merge_sort(self, key=None, reverse=False):
+        self.root = _build(sorted(self.traverse(), key=key, reverse=reverse))
+
+    def clear_list(self):
+        self.root = None
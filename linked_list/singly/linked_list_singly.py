@@ -1,43 +1,253 @@
+import sys
 import tkinter as tk
 from tkinter import messagebox
-from tkinter import filedialog
+from itertools import islice
+from skip_list import SkipListSequence
+from implicit_treap import ImplicitTreapSequence
+from list_visualizer import ListVisualizerMixin
+
+TRAVERSE_PREVIEW = 200
 
 class Node:
+    __slots__ = ('data', 'next')
+
     def __init__(self, data):
         self.data = data
         self.next = None
 
 class LinkedList:
-    def __init__(self):
+    def __init__(self, indexed=False):
         self.head = None
+        self.tail = None
+        self.size = 0
+        # Optional value -> {predecessor: None} map (None stands for "before
+        # head"); a singly list needs the predecessor to unlink in O(1).
+        # The map keeps no list order, so a value held more than once is
+        # still found by scanning for its first node.
+        self.index = None
+        if indexed:
+            self.rebuild_index()
+
+    def rebuild_index(self):
+        self.index = {}
+        prev = None
+        current = self.head
+        while current:
+            self.index.setdefault(current.data, {})[prev] = None
+            prev = current
+            current = current.next
+
+    def _index_move(self, data, old_prev, new_prev):
+        preds = self.index[data]
+        del preds[old_prev]
+        preds[new_prev] = None
+
+    def _index_discard(self, data, prev):
+        preds = self.index[data]
+        del preds[prev]
+        if not preds:
+            del self.index[data]
+
+    def _link_after(self, prev, new_node):
+        following = self.head if prev is None else prev.next
+        new_node.next = following
+        if prev is None:
+            self.head = new_node
+        else:
+            prev.next = new_node
+        if following is None:
+            self.tail = new_node
+        self.size += 1
+        if self.index is not None:
+            # Repoint the follower first: it may share new_node's value.
+            if following is not None:
+                self._index_move(following.data, prev, new_node)
+            self.index.setdefault(new_node.data, {})[prev] = None
+
+    def _unlink_after(self, prev):
+        node = self.head if prev is None else prev.next
+        following = node.next
+        if prev is None:
+            self.head = following
+        else:
+            prev.next = following
+        if following is None:
+            self.tail = prev
+        self.size -= 1
+        if self.index is not None:
+            self._index_discard(node.data, prev)
+            if following is not None:
+                self._index_move(following.data, node, prev)
+        node.next = None
+        return node
+
+    def _find_prev(self, data):
+        # Returns (found, predecessor) for the first node holding data.
+        if self.index is not None:
+            preds = self.index.get(data)
+            if not preds:
+                return False, None
+            if len(preds) == 1:
+                return True, next(iter(preds))
+        prev = None
+        current = self.head
+        while current:
+            if current.data == data:
+                return True, prev
+            prev = current
+            current = current.next
+        return False, None
 
     def append(self, data):
-        new_node = Node(data)
+        self._link_after(self.tail, Node(data))
+
+    @classmethod
+    def from_iterable(cls, iterable, indexed=False):
+        linked_list = cls(indexed=indexed)
+        linked_list.extend(iterable)
+        return linked_list
+
+    @staticmethod
+    def _link_chain(iterable):
+        dummy = Node(None)
+        tail = dummy
+        count = 0
+        for data in iterable:
+            tail.next = tail = Node(data)
+            count += 1
+        return dummy.next, tail, count
+
+    def _index_chain(self, prev, head, stop):
+        while head is not stop:
+            self.index.setdefault(head.data, {})[prev] = None
+            prev = head
+            head = head.next
+
+    def extend(self, iterable):
+        head, tail, count = self._link_chain(iterable)
+        if head is None:
+            return
+        if self.index is not None:
+            self._index_chain(self.tail, head, None)
         if self.head is None:
-            self.head = new_node
+            self.head = head
+        else:
+            self.tail.next = head
+        self.tail = tail
+        self.size += count
+
+    def extendleft(self, iterable):
+        head = tail = None
+        count = 0
+        for data in iterable:
+            new_node = Node(data)
+            new_node.next = head
+            head = new_node
+            if tail is None:
+                tail = new_node
+            count += 1
+        if head is None:
             return
-        last = self.head
-        while last.next:
-            last = last.next
-        last.next = new_node
+        old_head = self.head
+        tail.next = old_head
+        self.head = head
+        if self.tail is None:
+            self.tail = tail
+        self.size += count
+        if self.index is not None:
+            if old_head is not None:
+                self._index_move(old_head.data, None, tail)
+            self._index_chain(None, head, old_head)
 
     def insert_at_beginning(self, data):
-        new_node = Node(data)
-        new_node.next = self.head
-        self.head = new_node
+        self._link_after(None, Node(data))
 
     def insert_at_position(self, data, pos):
         if pos == 0:
             self.insert_at_beginning(data)
             return
-        new_node = Node(data)
+        if pos > self.size:
+            return
+        if pos == self.size:
+            self.append(data)
+            return
         current = self.head
         for _ in range(pos - 1):
-            if current is None:
-                return
             current = current.next
-        new_node.next = current.next
-        current.next = new_node
+        self._link_after(current, Node(data))
+
+    def insert_after(self, prev_data, data):
+        found, prev = self._find_prev(prev_data)
+        if not found:
+            return False
+        self._link_after(self.head if prev is None else prev.next, Node(data))
+        return True
+
+    def delete(self, data):
+        found, prev = self._find_prev(data)
+        if found:
+            self._unlink_after(prev)
+        return found
+
+    def delete_all(self, data):
+        removed = 0
+        if self.index is not None:
+            # Removing one occurrence can change the predecessor of the next,
+            # so re-read the index after every unlink.
+            while data in self.index:
+                self._unlink_after(next(iter(self.index[data])))
+                removed += 1
+            return removed
+        prev = None
+        current = self.head
+        while current:
+            if current.data == data:
+                current = current.next
+                self._unlink_after(prev)
+                removed += 1
+            else:
+                prev = current
+                current = current.next
+        return removed
+
+    def apply_batch(self, ops):
+        # ops is a list of (op, position, value) with op 'insert' or 'delete'.
+        # Positions refer to the list as it was before the batch, so the ops
+        # are applied in position order during a single forward walk. A
+        # delete only happens if value is None or matches the node's data.
+        # Returns one bool per op, in the order given.
+        results = [False] * len(ops)
+        prev = None
+        pos = 0
+        deleted = False
+        for i in sorted(range(len(ops)), key=lambda i: ops[i][1]):
+            op, target, value = ops[i]
+            if op not in ('insert', 'delete'):
+                raise ValueError(f"Unknown batch operation {op!r}")
+            if target < 0:
+                continue
+            while pos < target:
+                if not deleted:
+                    node = self.head if prev is None else prev.next
+                    if node is None:
+                        break
+                    prev = node
+                pos += 1
+                deleted = False
+            if pos < target:
+                continue
+            if op == 'insert':
+                new_node = Node(value)
+                self._link_after(prev, new_node)
+                prev = new_node
+                results[i] = True
+            elif not deleted:
+                node = self.head if prev is None else prev.next
+                if node is not None and (value is None or node.data == value):
+                    self._unlink_after(prev)
+                    deleted = True
+                    results[i] = True
+        return results
 
     def delete_at_position(self, data, pos):
         if pos == 0:
@@ -54,29 +264,25 @@ class LinkedList:
             current_pos += 1
             
         if temp and temp.data == data:
-            if prev:
-                prev.next = temp.next
-            else:
-                self.head = temp.next
-            temp = None
+            self._unlink_after(prev)
         else:
             messagebox.showinfo("Delete Node", f"Node with data {data} at position {pos} not found in the list.")
 
     def delete_from_beginning(self):
         if self.head is None:
             return
-        self.head = self.head.next
+        self._unlink_after(None)
 
     def delete_from_end(self):
         if self.head is None:
             return
         if self.head.next is None:
-            self.head = None
+            self._unlink_after(None)
             return
         second_last = self.head
         while second_last.next.next:
             second_last = second_last.next
-        second_last.next = None
+        self._unlink_after(second_last)
 
     def traverse(self):
         elements = []
@@ -86,7 +292,25 @@ class LinkedList:
             current = current.next
         return elements
 
+    def __iter__(self):
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
+
+    def __reversed__(self):
+        # Singly linked: going backwards needs a snapshot of the values.
+        return reversed(self.traverse())
+
+    def __len__(self):
+        return self.size
+
+    def view(self, start=0, stop=None, step=1):
+        return islice(self, start, stop, step)
+
     def search(self, data):
+        if self.index is not None:
+            return data in self.index
         current = self.head
         while current:
             if current.data == data:
@@ -95,73 +319,98 @@ class LinkedList:
         return False
 
     def length(self):
-        count = 0
-        current = self.head
-        while current:
-            count += 1
-            current = current.next
-        return count
+        return self.size
 
     def reverse(self):
         prev = None
         current = self.head
+        self.tail = current
         while current:
             next_node = current.next
             current.next = prev
             prev = current
             current = next_node
         self.head = prev
+        if self.index is not None:
+            self.rebuild_index()
 
-    def merge_sort(self):
+    def merge_sort(self, key=None, reverse=False):
         if self.head is None or self.head.next is None:
-            return self.head
-
-        def split(head):
-            fast = head
-            slow = head
-            while fast.next and fast.next.next:
-                fast = fast.next.next
-                slow = slow.next
-            middle = slow.next
-            slow.next = None
-            return head, middle
-
-        def merge(left, right):
-            dummy = Node(0)
+            return
+
+        # precedes(a, b) is true only when a must come strictly before b,
+        # which keeps equal elements in their original order.
+        if key is None:
+            if reverse:
+                precedes = lambda a, b: a.data > b.data
+            else:
+                precedes = lambda a, b: a.data < b.data
+        elif reverse:
+            precedes = lambda a, b: key(a.data) > key(b.data)
+        else:
+            precedes = lambda a, b: key(a.data) < key(b.data)
+
+        def merge(left_run, right_run):
+            left, left_tail = left_run
+            right, right_tail = right_run
+            dummy = Node(None)
             tail = dummy
             while left and right:
-                if left.data < right.data:
-                    tail.next, left = left, left.next
-                else:
+                if precedes(right, left):
                     tail.next, right = right, right.next
+                else:
+                    tail.next, left = left, left.next
                 tail = tail.next
-            tail.next = left or right
-            return dummy.next
-
-        def merge_sort_rec(head):
-            if head is None or head.next is None:
-                return head
-            left, right = split(head)
-            left = merge_sort_rec(left)
-            right = merge_sort_rec(right)
-            return merge(left, right)
-
-        self.head = merge_sort_rec(self.head)
+            if left:
+                tail.next = left
+                return dummy.next, left_tail
+            tail.next = right
+            return dummy.next, right_tail
+
+        # Cut the list into its existing ascending runs.
+        runs = []
+        run_head = current = self.head
+        while current.next:
+            if precedes(current.next, current):
+                next_head = current.next
+                current.next = None
+                runs.append((run_head, current))
+                run_head = current = next_head
+            else:
+                current = current.next
+        runs.append((run_head, current))
+
+        while len(runs) > 1:
+            merged = [merge(runs[i], runs[i + 1]) for i in range(0, len(runs) - 1, 2)]
+            if len(runs) % 2:
+                merged.append(runs[-1])
+            runs = merged
+
+        self.head, self.tail = runs[0]
+        if self.index is not None:
+            self.rebuild_index()
         
     def clear_list(self):
-        self.head = None
+        self.head = self.tail = None
+        self.size = 0
+        if self.index is not None:
+            self.index.clear()
 
-class LinkedListVisualizer(tk.Tk):
-    def __init__(self):
+class LinkedListVisualizer(ListVisualizerMixin, tk.Tk):
+    def __init__(self, use_skip_list=False, use_treap=False):
         super().__init__()
         self.title("Singly Linked List Visualizer")
         self.geometry("800x600")
-        self.canvas = tk.Canvas(self, width=800, height=350, bg='white')
-        self.canvas.pack(pady=20)
-        self.linked_list = LinkedList()
-        self.node_positions = {}
-        self.operations = []
-        self.processing = False
+        self.create_canvas()
+        if use_skip_list:
+            self.list_class = SkipListSequence
+        elif use_treap:
+            self.list_class = ImplicitTreapSequence
+        else:
+            self.list_class = LinkedList
+        self.linked_list = self.list_class()
+        self.create_scheduler()
+        self.create_load_controls()
         self.create_controls()
         self.update_visualization()
 
@@ -217,6 +466,9 @@ class LinkedListVisualizer(tk.Tk):
 
         load_button = tk.Button(control_frame, text="Load List", command=self.load_list, width=button_width, height=button_height)
         load_button.grid(row=2, column=3, padx=5)
+
+        goto_button = tk.Button(control_frame, text="Go to Position", command=self.go_to_position, width=button_width, height=button_height)
+        goto_button.grid(row=0, column=4, padx=5)
         
         clear_button = tk.Button(control_frame, text="Clear List", command=self.clear_list, width=button_width, height=button_height)
         clear_button.grid(row=3, column=3, padx=5)
@@ -228,26 +480,10 @@ class LinkedListVisualizer(tk.Tk):
             messagebox.showerror("Invalid input", "Please enter an integer value.")
             return
     
-        self.linked_list.append(data)
-        self.update_visualization()
+        self.queue_operation(lambda: self.linked_list.append(data))
         
-    '''
-    def queue_operation(self, operation):
-        self.operations.append(operation)
-        if not self.processing:
-            self.process_next_operation()
-
-    def process_next_operation(self):
-        if self.operations:
-            self.processing = True
-            operation = self.operations.pop(0)
-            operation()
-            self.after(500, self.process_next_operation)
-        else:
-            self.processing = False
-    '''
-    
     def delete_node(self):
+        self.run_pending()
         try:
             data = int(self.entry.get())
             pos = int(self.position_entry.get())
@@ -259,8 +495,7 @@ class LinkedListVisualizer(tk.Tk):
             messagebox.showerror("Invalid Position", "Position is out of range.")
             return
         
-        self.linked_list.delete_at_position(data, pos)
-        self.update_visualization()
+        self.queue_operation(lambda: self.linked_list.delete_at_position(data, pos))
 
     def insert_at_beginning(self):
         try:
@@ -268,10 +503,10 @@ class LinkedListVisualizer(tk.Tk):
         except ValueError:
             messagebox.showerror("Invalid input", "Please enter an integer value.")
             return
-        self.linked_list.insert_at_beginning(data)
-        self.update_visualization()
+        self.queue_operation(lambda: self.linked_list.insert_at_beginning(data))
 
     def insert_at_position(self):
+        self.run_pending()
         try:
             data = int(self.entry.get())
             pos = int(self.position_entry.get())
@@ -283,24 +518,24 @@ class LinkedListVisualizer(tk.Tk):
             messagebox.showerror("Invalid Position", "Position must be within the range of the list.")
             return
 
-        self.linked_list.insert_at_position(data, pos)
-        self.update_visualization()
+        self.queue_operation(lambda: self.linked_list.insert_at_position(data, pos))
 
     def delete_from_beginning(self):
+        self.run_pending()
         if self.linked_list.head is None:
             messagebox.showerror("Empty List", "Cannot delete from an empty list.")
             return
-        self.linked_list.delete_from_beginning()
-        self.update_visualization()
+        self.queue_operation(lambda: self.linked_list.delete_from_beginning())
 
     def delete_from_end(self):
+        self.run_pending()
         if self.linked_list.head is None:
             messagebox.showerror("Empty List", "Cannot delete from an empty list.")
             return
-        self.linked_list.delete_from_end()
-        self.update_visualization()
+        self.queue_operation(lambda: self.linked_list.delete_from_end())
 
     def search_node(self):
+        self.drain_operations()
         try:
             data = int(self.entry.get())
         except ValueError:
@@ -313,67 +548,26 @@ class LinkedListVisualizer(tk.Tk):
             messagebox.showinfo("Search Result", f"Node with data {data} not found in the list.")
 
     def get_length(self):
+        self.run_pending()
         length = self.linked_list.length()
         messagebox.showinfo("List Length", f"The length of the list is {length}.")
 
     def traverse_list(self):
-        elements = self.linked_list.traverse()
-        messagebox.showinfo("Traversal Result", f"The elements in the list are: {elements}")
+        self.drain_operations()
+        elements = list(self.linked_list.view(0, TRAVERSE_PREVIEW))
+        remaining = self.linked_list.length() - len(elements)
+        more = f" ... and {remaining} more" if remaining > 0 else ""
+        messagebox.showinfo("Traversal Result", f"The elements in the list are: {elements}{more}")
 
     def reverse_list(self):
-        self.linked_list.reverse()
-        self.update_visualization()
+        self.queue_operation(lambda: self.linked_list.reverse())
 
     def sort_list(self):
-        self.linked_list.merge_sort()
-        self.update_visualization()
+        self.queue_operation(lambda: self.linked_list.merge_sort())
 
-    def update_visualization(self):
-        self.canvas.delete("all")
-        current = self.linked_list.head
-        x, y = 50, 200
-        self.node_positions.clear()
-        while current:
-            self.node_positions[current] = (x, y)
-            self.canvas.create_oval(x-20, y-20, x+20, y+20, fill="lightblue")
-            self.canvas.create_text(x, y, text=str(current.data))
-            if current is self.linked_list.head:
-                self.canvas.create_text(x-30, y-30, text="Head", anchor=tk.CENTER, font=("Arial", 10, "bold"))
-            if current.next is None:
-                self.canvas.create_text(x+30, y-30, text="Tail", anchor=tk.CENTER, font=("Arial", 10, "bold"))
-            if current.next:
-                self.canvas.create_line(x+20, y, x+80-20, y, arrow=tk.LAST)
-            x += 80
-            current = current.next
-
-    def save_list(self):
-        filename = filedialog.asksaveasfilename(defaultextension=".txt",
-                                               filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
-                                               title="Save Linked List")
-        if filename:
-            with open(filename, 'w') as file:
-                current = self.linked_list.head
-                while current:
-                    file.write(str(current.data) + '\n')
-                    current = current.next
-            messagebox.showinfo("Save List", f"List saved to {filename}")
-
-    def load_list(self):
-        filename = filedialog.askopenfilename(defaultextension=".txt",
-                                              filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
-                                              title="Open Linked List")
-        if filename:
-            self.linked_list = LinkedList()
-            with open(filename, 'r') as file:
-                for line in file:
-                    self.linked_list.append(int(line.strip()))
-            self.update_visualization()
-            messagebox.showinfo("Load List", f"List loaded from {filename}")
-    
     def clear_list(self):
-        self.linked_list.clear_list()
-        self.update_visualization()
+        self.queue_operation(lambda: self.linked_list.clear_list())
 
 if __name__ == "__main__":
-    app = LinkedListVisualizer()
+    app = LinkedListVisualizer(use_skip_list="--skip-list" in sys.argv, use_treap="--treap" in sys.argv)
     app.mainloop()
\ No newline at end of file
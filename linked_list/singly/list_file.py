@@ -0,0 +1,81 @@
+import os
+import sys
+import mmap
+import struct
+from array import array
+
+LIST_FILE_MAGIC = b'DSAL'
+LIST_FILE_VERSION = 1
+# magic, format version, element count; packed little-endian int64 values follow
+LIST_FILE_HEADER = struct.Struct('<4sIQ')
+# Values added to the list per step of a background load
+LOAD_CHUNK = 50_000
+
+def write_list_file(filename, values):
+    # Raises OverflowError before anything is written when a value does not
+    # fit the binary format's int64; text files take any int.
+    if filename.endswith('.txt'):
+        with open(filename, 'w') as file:
+            file.writelines(f"{value}\n" for value in values)
+        return
+    packed = array('q', values)
+    if sys.byteorder != 'little':
+        packed.byteswap()
+    with open(filename, 'wb') as file:
+        file.write(LIST_FILE_HEADER.pack(LIST_FILE_MAGIC, LIST_FILE_VERSION, len(packed)))
+        packed.tofile(file)
+
+def iter_list_file(filename, chunk_size=LOAD_CHUNK):
+    # Binary snapshots are mapped and sliced without parsing; anything
+    # without the magic header is read as one int per line. Yields (values,
+    # fraction read) in chunks so a long load can report progress and stop
+    # between chunks.
+    with open(filename, 'rb') as file:
+        header = file.read(LIST_FILE_HEADER.size)
+        if len(header) == LIST_FILE_HEADER.size and header.startswith(LIST_FILE_MAGIC):
+            _, version, count = LIST_FILE_HEADER.unpack(header)
+            if version != LIST_FILE_VERSION:
+                raise ValueError(f"Unsupported list file version {version}")
+            start = LIST_FILE_HEADER.size
+            if os.fstat(file.fileno()).st_size - start != count * 8:
+                raise ValueError(f"List file should hold {count} values but its size does not match")
+            if count == 0:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped)[start:start + count * 8] as raw:
+                    for offset in range(0, count, chunk_size):
+                        chunk = array('q')
+                        chunk.frombytes(raw[offset * 8:(offset + chunk_size) * 8])
+                        if sys.byteorder != 'little':
+                            chunk.byteswap()
+                        yield chunk, min(offset + chunk_size, count) / count
+            return
+        total = os.fstat(file.fileno()).st_size
+        file.seek(0)
+        chunk = []
+        done = 0
+        for line in file:
+            done += len(line)
+            if line.strip():
+                chunk.append(int(line))
+                if len(chunk) == chunk_size:
+                    yield chunk, done / total
+                    chunk = []
+        if chunk:
+            yield chunk, 1.0
+
+def load_list_file(filename, list_class, updates, cancel):
+    # Worker thread body: builds the whole list off the Tk thread and
+    # reports through the updates queue. The caller only ever receives the
+    # finished list, never a partially built one.
+    try:
+        linked_list = list_class()
+        for chunk, progress in iter_list_file(filename):
+            if cancel.is_set():
+                updates.put(('cancelled', None))
+                return
+            linked_list.extend(chunk)
+            updates.put(('progress', progress))
+        updates.put(('done', linked_list))
+    except (OSError, ValueError) as error:
+        updates.put(('error', error))
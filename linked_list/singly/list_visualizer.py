@@ -0,0 +1,321 @@
+import queue
+import threading
+import time
+import tkinter as tk
+from tkinter import ttk
+from tkinter import messagebox
+from tkinter import filedialog
+from itertools import islice
+from collections import deque
+from list_file import write_list_file, load_list_file
+
+NODE_STEP = 80
+# Time budget for one batch of queued operations
+OPERATION_BATCH_SECONDS = 0.015
+# Nodes rendered on each side of the visible window
+RENDER_MARGIN = 5
+
+# How often the visualizer checks on a background load, in milliseconds
+LOAD_POLL_MS = 50
+
+# Parts shared by the singly and doubly list visualizers. Hooks with empty
+# bodies here are filled in by a visualizer that needs them.
+class ListVisualizerMixin:
+    # Arrowhead of the link drawn to the next node
+    LINK_ARROW = tk.LAST
+    # Nodes have prev links, so node_at may walk back from the cursor
+    BACKWARD_LINKS = False
+
+    def create_canvas(self):
+        self.canvas = tk.Canvas(self, width=800, height=350, bg='white')
+        self.canvas.pack(pady=(20, 0))
+        self.scrollbar = tk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.scroll_canvas)
+        self.scrollbar.pack(fill=tk.X)
+        self.canvas.configure(xscrollcommand=self.scrollbar.set)
+        self.canvas.bind("<Configure>", lambda event: self.render_window())
+        self.node_positions = {}
+        self.node_items = {}
+        self.cursor = None
+        self.head_label = self.canvas.create_text(0, 0, text="Head", anchor=tk.CENTER, font=("Arial", 10, "bold"), state=tk.HIDDEN)
+        self.tail_label = self.canvas.create_text(0, 0, text="Tail", anchor=tk.CENTER, font=("Arial", 10, "bold"), state=tk.HIDDEN)
+
+    def create_scheduler(self):
+        self.operations = deque()
+        self.processing = False
+        self.redraw_pending = False
+        self.backlog_label = tk.Label(self, anchor=tk.W)
+        self.backlog_label.pack(fill=tk.X, padx=10)
+        self.update_backlog()
+
+    def create_load_controls(self):
+        load_frame = tk.Frame(self)
+        load_frame.pack(fill=tk.X, padx=10)
+        self.load_progress = ttk.Progressbar(load_frame, maximum=1.0, length=300)
+        self.load_progress.pack(side=tk.LEFT)
+        self.cancel_load_button = tk.Button(load_frame, text="Cancel Load", command=self.cancel_load, state=tk.DISABLED)
+        self.cancel_load_button.pack(side=tk.LEFT, padx=5)
+        self.loader = None
+
+    def list_changed(self):
+        # Called before an operation is queued and when a loaded list
+        # replaces the current one.
+        pass
+
+    def node_rendered(self, node):
+        # Called for each node drawn in the window, after its items are placed.
+        pass
+
+    def queue_operation(self, operation):
+        # Operations run against the list as soon as the event loop is idle,
+        # in batches bounded by OPERATION_BATCH_SECONDS, and all operations
+        # of a batch share a single redraw.
+        self.list_changed()
+        self.operations.append(operation)
+        self.update_backlog()
+        if not self.processing:
+            self.processing = True
+            self.after_idle(self.process_operations)
+
+    def process_operations(self):
+        deadline = time.perf_counter() + OPERATION_BATCH_SECONDS
+        while self.operations and time.perf_counter() < deadline:
+            self.run_operation()
+        self.request_redraw()
+        self.update_backlog()
+        if self.operations:
+            # Yield to the event loop so the redraw and input get a turn.
+            self.after(1, self.process_operations)
+        else:
+            self.processing = False
+
+    def run_pending(self):
+        # Run everything still queued, so a check against the list sees its
+        # latest state; the canvas catches up with the next idle redraw.
+        if self.operations:
+            while self.operations:
+                self.run_operation()
+            self.request_redraw()
+            self.update_backlog()
+
+    def drain_operations(self):
+        # Also redraw now, for reads that show the list or scroll the canvas.
+        self.run_pending()
+        self.flush_redraw()
+
+    def run_operation(self):
+        # The edit may unlink the cursor node or shift its index, and a
+        # scroll can render before the redraw resets it, so drop it now.
+        self.operations.popleft()()
+        self.cursor = None
+
+    def request_redraw(self):
+        if not self.redraw_pending:
+            self.redraw_pending = True
+            self.after_idle(self.flush_redraw)
+
+    def flush_redraw(self):
+        if self.redraw_pending:
+            self.redraw_pending = False
+            self.update_visualization()
+
+    def update_backlog(self):
+        self.backlog_label.configure(text=f"Pending operations: {len(self.operations)}")
+
+    def update_visualization(self):
+        # The list may have changed shape, so the cached cursor is stale.
+        self.cursor = None
+        self.render_window()
+
+    def render_window(self):
+        # Only nodes inside the visible part of the scroll region (plus a
+        # margin) get canvas items. Nodes that stay in view keep their items
+        # and only those whose slot, value or outgoing link changed are touched.
+        self.canvas.delete("highlight")
+        y = 200
+        size = self.linked_list.length()
+        self.canvas.configure(scrollregion=(0, 0, 50 + NODE_STEP * size, 350))
+        left = self.canvas.canvasx(0)
+        width = max(self.canvas.winfo_width(), int(self.canvas['width']))
+        first = max(0, int(left - 50) // NODE_STEP - RENDER_MARGIN)
+        last = min(size, int(left + width - 50) // NODE_STEP + 1 + RENDER_MARGIN)
+
+        previous = self.node_items
+        self.node_items = {}
+        self.node_positions.clear()
+        head_x = tail_x = None
+        index = first
+        for current in islice(self.nodes_from(first), last - first) if first < last else ():
+            if index == first:
+                self.cursor = (first, current)
+            x = 50 + NODE_STEP * index
+            items = previous.pop(current, None)
+            if items is None:
+                items = self.create_node_items(current.data, x, y)
+            else:
+                self.move_node_items(items, current.data, x, y)
+            self.set_link_arrow(items, index < size - 1, y)
+            self.node_items[current] = items
+            self.node_positions[current] = (x, y)
+            self.node_rendered(current)
+            if index == 0:
+                head_x = x
+            if index == size - 1:
+                tail_x = x
+            index += 1
+        for items in previous.values():
+            self.canvas.delete(*(item for item in items[:3] if item is not None))
+        self.place_label(self.head_label, head_x, -30, y)
+        self.place_label(self.tail_label, tail_x, 30, y)
+
+    def node_at(self, index):
+        node_at = getattr(self.linked_list, 'node_at', None)
+        if node_at is not None:
+            return node_at(index)
+        if self.BACKWARD_LINKS and self.cursor is not None and self.cursor[0] > index \
+                and self.cursor[0] - index < index:
+            # Closer to the cursor than to the head: walk the prev links back.
+            i, node = self.cursor
+            while i > index:
+                node = node.prev
+                i -= 1
+            return node
+        if self.cursor is not None and self.cursor[0] <= index:
+            i, node = self.cursor
+        else:
+            i, node = 0, self.linked_list.head
+        while node is not None and i < index:
+            node = node.next
+            i += 1
+        return node
+
+    def nodes_from(self, index):
+        # Nodes from position index on. Sequences that are not a chain of
+        # next links (the treap) provide their own in-order walk.
+        nodes_from = getattr(self.linked_list, 'nodes_from', None)
+        if nodes_from is not None:
+            return nodes_from(index)
+        return self.walk_from(self.node_at(index))
+
+    @staticmethod
+    def walk_from(node):
+        while node is not None:
+            yield node
+            node = node.next
+
+    def scroll_canvas(self, *args):
+        self.canvas.xview(*args)
+        self.render_window()
+
+    def go_to_position(self):
+        self.drain_operations()
+        try:
+            pos = int(self.position_entry.get())
+        except ValueError:
+            messagebox.showerror("Invalid input", "Please enter a position as an integer.")
+            return
+        if pos < 0 or pos >= self.linked_list.length():
+            messagebox.showerror("Invalid Position", "Position is out of range.")
+            return
+        self.scroll_to(pos)
+
+    def scroll_to(self, pos):
+        # Center the view on position pos and render that window.
+        size = self.linked_list.length()
+        width = max(self.canvas.winfo_width(), int(self.canvas['width']))
+        self.canvas.xview_moveto(max(0, 50 + NODE_STEP * pos - width // 2) / (50 + NODE_STEP * size))
+        self.render_window()
+
+    def create_node_items(self, data, x, y):
+        oval = self.canvas.create_oval(x-20, y-20, x+20, y+20, fill="lightblue")
+        text = self.canvas.create_text(x, y, text=str(data))
+        return [oval, text, None, x, data]
+
+    def move_node_items(self, items, data, x, y):
+        oval, text, arrow, old_x, old_data = items
+        if old_x != x:
+            for item in (oval, text, arrow):
+                if item is not None:
+                    self.canvas.move(item, x - old_x, 0)
+            items[3] = x
+        if old_data != data:
+            self.canvas.itemconfigure(text, text=str(data))
+            items[4] = data
+
+    def set_link_arrow(self, items, has_next, y):
+        if has_next and items[2] is None:
+            x = items[3]
+            items[2] = self.canvas.create_line(x+20, y, x+80-20, y, arrow=self.LINK_ARROW)
+        elif not has_next and items[2] is not None:
+            self.canvas.delete(items[2])
+            items[2] = None
+
+    def place_label(self, label, x, dx, y):
+        if x is None:
+            self.canvas.itemconfigure(label, state=tk.HIDDEN)
+        else:
+            self.canvas.coords(label, x+dx, y-30)
+            self.canvas.itemconfigure(label, state=tk.NORMAL)
+
+    def save_list(self):
+        self.drain_operations()
+        filename = filedialog.asksaveasfilename(defaultextension=".bin",
+                                               filetypes=[("Binary list files", "*.bin"), ("Text files", "*.txt"), ("All files", "*.*")],
+                                               title="Save Linked List")
+        if filename:
+            try:
+                write_list_file(filename, self.linked_list)
+            except OverflowError:
+                messagebox.showerror("Error", "The list holds values that do not fit a binary list file; "
+                                              "save it as a .txt file instead")
+                return
+            messagebox.showinfo("Save List", f"List saved to {filename}")
+
+    def load_list(self):
+        if self.loader is not None:
+            messagebox.showinfo("Load List", "A list is already being loaded.")
+            return
+        filename = filedialog.askopenfilename(filetypes=[("List files", "*.bin *.txt"), ("All files", "*.*")],
+                                              title="Open Linked List")
+        if filename:
+            self.load_filename = filename
+            self.load_updates = queue.Queue()
+            self.load_cancel = threading.Event()
+            self.loader = threading.Thread(target=load_list_file, daemon=True,
+                                           args=(filename, self.list_class, self.load_updates, self.load_cancel))
+            self.loader.start()
+            self.load_progress['value'] = 0
+            self.cancel_load_button.configure(state=tk.NORMAL)
+            self.after(LOAD_POLL_MS, self.poll_load)
+
+    def poll_load(self):
+        while True:
+            try:
+                kind, payload = self.load_updates.get_nowait()
+            except queue.Empty:
+                break
+            if kind != 'progress':
+                self.finish_load(kind, payload)
+                return
+            self.load_progress['value'] = payload
+        self.after(LOAD_POLL_MS, self.poll_load)
+
+    def finish_load(self, kind, payload):
+        self.loader = None
+        self.cancel_load_button.configure(state=tk.DISABLED)
+        if kind == 'done' and not self.load_cancel.is_set():
+            # Anything queued against the old list runs first, then the
+            # loaded list replaces it in one step.
+            self.drain_operations()
+            self.list_changed()
+            self.linked_list = payload
+            self.load_progress['value'] = 1.0
+            self.update_visualization()
+            messagebox.showinfo("Load List", f"List loaded from {self.load_filename}")
+            return
+        self.load_progress['value'] = 0
+        if kind == 'error':
+            messagebox.showerror("Load List", f"Could not load {self.load_filename}: {payload}")
+
+    def cancel_load(self):
+        if self.loader is not None:
+            self.load_cancel.set()
@@ -0,0 +1,256 @@
+import random
+from itertools import islice
+
+MAX_LEVEL = 32
+P = 0.25
+
+class SkipNode:
+    __slots__ = ('data', 'forward', 'span')
+
+    def __init__(self, data, level):
+        self.data = data
+        self.forward = [None] * level
+        # span[i] is how many level-0 steps forward[i] jumps over
+        self.span = [0] * level
+
+    @property
+    def next(self):
+        return self.forward[0]
+
+# Sequence with the LinkedList and DoublyLinkedList interfaces, backed by an
+# indexable skip list. Nodes are kept in insertion order (not sorted); each
+# forward pointer records its span so positional access, insert and delete
+# run in O(log n) expected.
+class SkipListSequence:
+    def __init__(self):
+        self.header = SkipNode(None, MAX_LEVEL)
+        self.level = 1
+        self.tail = None
+        self.size = 0
+
+    @property
+    def head(self):
+        return self.header.forward[0]
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        sequence = cls()
+        sequence.extend(iterable)
+        return sequence
+
+    @staticmethod
+    def random_level():
+        level = 1
+        while level < MAX_LEVEL and random.random() < P:
+            level += 1
+        return level
+
+    def _predecessors(self, pos):
+        # For every level, the last node before position pos and its rank
+        # (header has rank 0, the node at position i has rank i + 1).
+        update = [None] * MAX_LEVEL
+        rank = [0] * MAX_LEVEL
+        x = self.header
+        traversed = 0
+        for lvl in range(self.level - 1, -1, -1):
+            while x.forward[lvl] is not None and traversed + x.span[lvl] <= pos:
+                traversed += x.span[lvl]
+                x = x.forward[lvl]
+            update[lvl] = x
+            rank[lvl] = traversed
+        return update, rank
+
+    def node_at(self, pos):
+        if pos < 0 or pos >= self.size:
+            raise IndexError("position out of range")
+        x = self.header
+        traversed = 0
+        for lvl in range(self.level - 1, -1, -1):
+            while x.forward[lvl] is not None and traversed + x.span[lvl] <= pos + 1:
+                traversed += x.span[lvl]
+                x = x.forward[lvl]
+        return x
+
+    def get(self, pos):
+        return self.node_at(pos).data
+
+    def __getitem__(self, pos):
+        if pos < 0:
+            pos += self.size
+        return self.get(pos)
+
+    def insert_at_position(self, data, pos):
+        if pos < 0 or pos > self.size:
+            return
+        update, rank = self._predecessors(pos)
+        level = self.random_level()
+        if level > self.level:
+            for lvl in range(self.level, level):
+                update[lvl] = self.header
+                rank[lvl] = 0
+                self.header.span[lvl] = self.size
+            self.level = level
+        new_node = SkipNode(data, level)
+        for lvl in range(level):
+            prev = update[lvl]
+            new_node.forward[lvl] = prev.forward[lvl]
+            new_node.span[lvl] = prev.span[lvl] - (pos - rank[lvl])
+            prev.forward[lvl] = new_node
+            prev.span[lvl] = pos - rank[lvl] + 1
+        for lvl in range(level, self.level):
+            update[lvl].span[lvl] += 1
+        if new_node.forward[0] is None:
+            self.tail = new_node
+        self.size += 1
+
+    def append(self, data):
+        self.insert_at_position(data, self.size)
+
+    def insert_at_beginning(self, data):
+        self.insert_at_position(data, 0)
+
+    def insert_after(self, prev_data, data):
+        pos = self._index_of(prev_data)
+        if pos is None:
+            return False
+        self.insert_at_position(data, pos + 1)
+        return True
+
+    def extend(self, iterable):
+        if self.size:
+            for data in iterable:
+                self.append(data)
+            return
+        # Building from empty: link each level left to right in one pass.
+        last = [self.header] * MAX_LEVEL
+        last_rank = [0] * MAX_LEVEL
+        count = 0
+        for data in iterable:
+            count += 1
+            level = self.random_level()
+            new_node = SkipNode(data, level)
+            for lvl in range(level):
+                last[lvl].forward[lvl] = new_node
+                last[lvl].span[lvl] = count - last_rank[lvl]
+                last[lvl] = new_node
+                last_rank[lvl] = count
+            if level > self.level:
+                self.level = level
+        if count:
+            self.tail = last[0]
+            self.size = count
+
+    def extendleft(self, iterable):
+        for data in iterable:
+            self.insert_at_beginning(data)
+
+    def _delete(self, pos):
+        update, _ = self._predecessors(pos)
+        target = update[0].forward[0]
+        for lvl in range(self.level):
+            prev = update[lvl]
+            if prev.forward[lvl] is target:
+                prev.span[lvl] += target.span[lvl] - 1
+                prev.forward[lvl] = target.forward[lvl]
+            else:
+                prev.span[lvl] -= 1
+        while self.level > 1 and self.header.forward[self.level - 1] is None:
+            self.level -= 1
+        if target is self.tail:
+            self.tail = update[0] if update[0] is not self.header else None
+        self.size -= 1
+        return target
+
+    def delete_at_position(self, *args):
+        # Takes (pos) like DoublyLinkedList or (data, pos) like LinkedList,
+        # as ImplicitTreapSequence does.
+        pos = args[-1]
+        if pos < 0 or pos >= self.size:
+            return False
+        if len(args) == 2 and pos != 0 and self.node_at(pos).data != args[0]:
+            return False
+        self._delete(pos)
+        return True
+
+    def delete(self, data):
+        pos = self._index_of(data)
+        if pos is None:
+            return False
+        self._delete(pos)
+        return True
+
+    def _index_of(self, data):
+        for pos, value in enumerate(self):
+            if value == data:
+                return pos
+        return None
+
+    def delete_from_beginning(self):
+        if self.size:
+            self._delete(0)
+
+    def delete_from_end(self):
+        if self.size:
+            self._delete(self.size - 1)
+
+    def traverse(self):
+        elements = []
+        current = self.header.forward[0]
+        while current:
+            elements.append(current.data)
+            current = current.forward[0]
+        return elements
+
+    def __iter__(self):
+        current = self.header.forward[0]
+        while current:
+            yield current.data
+            current = current.forward[0]
+
+    def __reversed__(self):
+        return reversed(self.traverse())
+
+    def __len__(self):
+        return self.size
+
+    def view(self, start=0, stop=None, step=1):
+        # Jump straight to start in O(log n), then walk level 0 lazily.
+        if start >= self.size:
+            return iter(())
+        if stop is not None:
+            stop = max(stop - start, 0)
+        return islice(self._iter_from(self.node_at(start)), 0, stop, step)
+
+    @staticmethod
+    def _iter_from(node):
+        while node:
+            yield node.data
+            node = node.forward[0]
+
+    def search(self, data):
+        current = self.header.forward[0]
+        while current:
+            if current.data == data:
+                return True
+            current = current.forward[0]
+        return False
+
+    def length(self):
+        return self.size
+
+    def reverse(self):
+        elements = self.traverse()
+        elements.reverse()
+        self.clear_list()
+        self.extend(elements)
+
+    def merge_sort(self, key=None, reverse=False):
+        elements = sorted(self.traverse(), key=key, reverse=reverse)
+        self.clear_list()
+        self.extend(elements)
+
+    def clear_list(self):
+        self.header = SkipNode(None, MAX_LEVEL)
+        self.level = 1
+        self.tail = None
+        self.size = 0
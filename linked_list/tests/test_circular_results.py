@@ -0,0 +1,32 @@
+import os
+import sys
+
+import pytest
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(here, '..', 'circular'))
+
+from circular_singly.circular_singly import CircularSinglyLinkedList
+from circular_doubly.circular_doubly import CircularDoublyLinkedList
+from ring_buffer.ring_buffer import RingBuffer
+
+RINGS = [
+    lambda: CircularSinglyLinkedList(),
+    lambda: CircularSinglyLinkedList(indexed=True),
+    lambda: CircularDoublyLinkedList(),
+    lambda: CircularDoublyLinkedList(indexed=True),
+    lambda: RingBuffer(),
+]
+
+@pytest.mark.parametrize('make_ring', RINGS)
+def test_misses_return_false_without_printing(make_ring, capsys):
+    ring = make_ring()
+    assert ring.delete(1) is False
+    assert ring.search(1) is False
+    assert ring.insert_after(1, 2) is False
+    ring.append(1)
+    assert ring.delete(2) is False
+    assert ring.insert_after(2, 3) is False
+    assert ring.insert_after(1, 3) is True
+    assert list(ring) == [1, 3]
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,51 @@
+import os
+import random
+import sys
+
+import pytest
+
+here = os.path.dirname(os.path.abspath(__file__))
+for directory in ('singly', 'doubly', 'circular'):
+    sys.path.insert(0, os.path.join(here, '..', directory))
+
+from linked_list_singly import LinkedList
+from linked_list_doubly import DoublyLinkedList
+from circular_singly.circular_singly import CircularSinglyLinkedList
+from circular_doubly.circular_doubly import CircularDoublyLinkedList
+
+CLASSES = [
+    (LinkedList, 'insert_at_beginning'),
+    (DoublyLinkedList, 'insert_at_beginning'),
+    (CircularSinglyLinkedList, 'prepend'),
+    (CircularDoublyLinkedList, 'prepend'),
+]
+
+def run_sequence(cls, prepend, indexed, steps):
+    linked_list = cls(indexed=indexed)
+    for step, args in steps:
+        getattr(linked_list, prepend if step == 'prepend' else step)(*args)
+    return list(linked_list)
+
+@pytest.mark.parametrize('cls, prepend', CLASSES)
+def test_duplicate_delete_matches_unindexed(cls, prepend):
+    steps = [('append', (2,)), ('append', (1,)), ('prepend', (1,)), ('delete', (1,))]
+    assert run_sequence(cls, prepend, False, steps) == [2, 1]
+    assert run_sequence(cls, prepend, True, steps) == [2, 1]
+
+@pytest.mark.parametrize('cls, prepend', CLASSES)
+def test_duplicate_insert_after_matches_unindexed(cls, prepend):
+    steps = [('append', (2,)), ('append', (1,)), ('prepend', (1,)), ('insert_after', (1, 9))]
+    assert run_sequence(cls, prepend, False, steps) == [1, 9, 2, 1]
+    assert run_sequence(cls, prepend, True, steps) == [1, 9, 2, 1]
+
+@pytest.mark.parametrize('cls, prepend', CLASSES)
+def test_random_duplicates_match_unindexed(cls, prepend):
+    rng = random.Random(6)
+    steps = []
+    for _ in range(500):
+        step = rng.choice(['append', 'prepend', 'delete', 'insert_after'])
+        if step == 'insert_after':
+            steps.append((step, (rng.randrange(4), rng.randrange(4))))
+        else:
+            steps.append((step, (rng.randrange(4),)))
+    assert run_sequence(cls, prepend, True, steps) == run_sequence(cls, prepend, False, steps)
@@ -0,0 +1,30 @@
+import os
+import sys
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(here, '..', 'pooled'))
+
+from pooled_linked_list import PooledLinkedList, PooledDoublyLinkedList
+
+def test_negative_insert_is_a_no_op():
+    for cls in (PooledLinkedList, PooledDoublyLinkedList):
+        linked_list = cls()
+        linked_list.insert_at_position(5, -1)
+        assert list(linked_list) == [] and len(linked_list) == 0
+        linked_list = cls.from_iterable([1, 2, 3])
+        linked_list.insert_at_position(5, -1)
+        assert list(linked_list) == [1, 2, 3]
+
+def test_out_of_range_delete_returns_false():
+    linked_list = PooledLinkedList.from_iterable([1, 2, 3])
+    assert linked_list.delete_at_position(2, -3) is False
+    assert list(linked_list) == [1, 2, 3]
+    assert PooledLinkedList().delete_at_position(0, 0) is False
+    assert linked_list.delete_at_position(2, 1) is True
+    assert list(linked_list) == [1, 3]
+
+def test_doubly_out_of_range_delete_is_a_no_op():
+    linked_list = PooledDoublyLinkedList.from_iterable([1, 2, 3])
+    linked_list.delete_at_position(-1)
+    linked_list.delete_at_position(3)
+    assert list(linked_list) == [1, 2, 3]
@@ -0,0 +1,27 @@
+import os
+import sys
+from itertools import islice
+
+import pytest
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(here, '..', 'circular'))
+
+from ring_buffer.ring_buffer import RingBuffer
+
+def test_view_matches_islice_across_the_wrap():
+    ring = RingBuffer(8)
+    ring.extend(range(6))
+    ring.extendleft([10, 11])
+    values = list(ring)
+    for start, stop, step in [(0, None, 1), (1, 6, 2), (3, 100, 3), (7, None, 1), (9, None, 1), (2, 2, 1)]:
+        assert list(ring.view(start, stop, step)) == list(islice(values, start, stop, step))
+
+def test_view_is_lazy_and_rejects_what_islice_rejects():
+    ring = RingBuffer.from_iterable(range(5))
+    view = ring.view()
+    assert iter(view) is view
+    with pytest.raises(ValueError):
+        ring.view(-1)
+    with pytest.raises(ValueError):
+        ring.view(0, None, 0)
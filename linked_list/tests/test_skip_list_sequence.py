@@ -0,0 +1,29 @@
+import os
+import sys
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(here, '..', 'singly'))
+
+from skip_list import SkipListSequence
+
+def test_delete_at_position_takes_either_signature():
+    sequence = SkipListSequence.from_iterable([1, 2, 3, 4])
+    assert sequence.delete_at_position(1) is True
+    assert list(sequence) == [1, 3, 4]
+    assert sequence.delete_at_position(9, 1) is False
+    assert sequence.delete_at_position(3, 1) is True
+    assert list(sequence) == [1, 4]
+    assert sequence.delete_at_position(-1) is False
+    assert sequence.delete_at_position(2) is False
+    assert list(sequence) == [1, 4]
+
+def test_delete_and_insert_after_use_the_first_match():
+    sequence = SkipListSequence.from_iterable([2, 1, 3, 1])
+    assert sequence.insert_after(1, 9) is True
+    assert list(sequence) == [2, 1, 9, 3, 1]
+    assert sequence.delete(1) is True
+    assert list(sequence) == [2, 9, 3, 1]
+    assert sequence.delete(5) is False
+    assert sequence.insert_after(5, 0) is False
+    assert list(sequence) == [2, 9, 3, 1]
+    assert [sequence[i] for i in range(len(sequence))] == [2, 9, 3, 1]
@@ -0,0 +1,150 @@
+import argparse
+import random
+import sys
+import time
+from collections import deque
+
+QUEUE_CAPACITY = 10
+
+class QueueEngine:
+    # Queue state and operations without any display, so the same logic runs
+    # behind QueueVisualizer or from the command line. Operations return the
+    # value they acted on, or None when the queue was full or empty.
+    def __init__(self, capacity=QUEUE_CAPACITY, seed=None):
+        self.capacity = capacity
+        self.queue = deque(maxlen=capacity)
+        self.random = random.Random(seed)
+
+        # Statistics
+        self.operations_count = 0
+        self.start_time = time.time()
+
+    def __len__(self):
+        return len(self.queue)
+
+    def __iter__(self):
+        return iter(self.queue)
+
+    def is_full(self):
+        return len(self.queue) >= self.capacity
+
+    def enqueue(self, value=None):
+        if self.is_full():
+            return None
+        if value is None:
+            value = self.random.randint(1, 99)
+        self.queue.append(value)
+        self.operations_count += 1
+        return value
+
+    def dequeue(self):
+        if not self.queue:
+            return None
+        self.operations_count += 1
+        return self.queue.popleft()
+
+    def peek(self):
+        if not self.queue:
+            return None
+        return self.queue[0]
+
+    def clear(self):
+        self.queue.clear()
+
+    def choose_operation(self):
+        return self.random.choice(('enqueue', 'dequeue'))
+
+    def random_operation(self):
+        # Enqueue or dequeue with equal odds; returns (operation, value).
+        operation = self.choose_operation()
+        if operation == 'enqueue':
+            return operation, self.enqueue()
+        return operation, self.dequeue()
+
+    def elapsed(self):
+        return time.time() - self.start_time
+
+def random_script(engine, count):
+    # Operation names for count random operations, drawn from the engine's
+    # generator so a seeded run is repeatable.
+    for _ in range(count):
+        yield engine.choose_operation(), None
+
+def read_script(filename, repeat=1):
+    # One operation per line: "enqueue [value]", "dequeue", "peek" or "clear".
+    # Blank lines and lines starting with # are skipped.
+    steps = []
+    with open(filename) as file:
+        for number, line in enumerate(file, 1):
+            words = line.split()
+            if not words or words[0].startswith('#'):
+                continue
+            operation = words[0]
+            if operation not in ('enqueue', 'dequeue', 'peek', 'clear') or len(words) > 2 \
+                    or (len(words) == 2 and operation != 'enqueue'):
+                raise ValueError(f"{filename}:{number}: cannot parse {line.strip()!r}")
+            steps.append((operation, int(words[1]) if len(words) == 2 else None))
+    for _ in range(repeat):
+        yield from steps
+
+def simulate(engine, steps, total, samples):
+    # Run the steps and yield (operations done, mean occupancy, size) once
+    # per window of total // samples operations, plus once at the end.
+    # Mean occupancy is the average queue length over the window.
+    window = max(total // samples, 1)
+    queue = engine.queue
+    actions = {'enqueue': engine.enqueue, 'dequeue': engine.dequeue,
+               'peek': engine.peek, 'clear': engine.clear}
+    done = occupied = in_window = 0
+    for operation, value in steps:
+        if value is None:
+            actions[operation]()
+        else:
+            engine.enqueue(value)
+        occupied += len(queue)
+        done += 1
+        in_window += 1
+        if in_window == window:
+            yield done, occupied / in_window, len(queue)
+            occupied = in_window = 0
+    if in_window:
+        yield done, occupied / in_window, len(queue)
+
+def positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run queue operations without a display.")
+    parser.add_argument('--operations', type=int, default=1_000_000,
+                        help="random operations to run (default: %(default)s)")
+    parser.add_argument('--script', help="file of operations to run instead of random ones")
+    parser.add_argument('--repeat', type=int, default=1, help="times to run the script (default: %(default)s)")
+    parser.add_argument('--capacity', type=positive_int, default=QUEUE_CAPACITY,
+                        help="queue capacity (default: %(default)s)")
+    parser.add_argument('--seed', type=int, help="seed for repeatable random runs")
+    parser.add_argument('--samples', type=positive_int, default=10,
+                        help="occupancy reports over the run (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    engine = QueueEngine(args.capacity, args.seed)
+    if args.script:
+        steps = list(read_script(args.script, args.repeat))
+        total = len(steps)
+    else:
+        steps = random_script(engine, args.operations)
+        total = args.operations
+
+    print(f"{'operations':>12} {'mean size':>10} {'occupancy':>10} {'size':>6}")
+    start = time.perf_counter()
+    done = 0
+    for done, mean, size in simulate(engine, steps, total, args.samples):
+        print(f"{done:>12} {mean:>10.2f} {mean / engine.capacity:>10.1%} {size:>6}")
+    elapsed = time.perf_counter() - start
+    print(f"{done} operations in {elapsed:.3f}s ({done / elapsed if elapsed else 0:,.0f} ops/sec), "
+          f"{engine.operations_count} changed the queue")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,6 @@
 import pygame
 import sys
-from collections import deque
-import random
-import time
-
-# Initialize Pygame
-pygame.init()
+from queue_engine import QueueEngine
 
 # Constants
 SCREEN_WIDTH = 1200
@@ -28,17 +23,22 @@ SUCCESS_COLOR = (46, 139, 87)  # Sea green
 ITEM_WIDTH = 60
 ITEM_HEIGHT = 60
 ITEM_SPACING = 10
-QUEUE_CAPACITY = 10
 ANIMATION_SPEED = 5
+MESSAGE_MS = 2000
+
+# Screen areas redrawn when their contents change
+STATS_AREA = pygame.Rect(50, 50, 300, 90)
 
 class QueueVisualizer:
-    def __init__(self):
+    # A view over a QueueEngine: the engine owns the queue and statistics,
+    # this class only draws them and turns clicks into engine calls.
+    def __init__(self, engine=None):
+        pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Queue Visualizer")
         self.clock = pygame.time.Clock()
         
-        # Initialize queue
-        self.queue = deque(maxlen=QUEUE_CAPACITY)
+        self.engine = engine or QueueEngine()
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         
@@ -52,14 +52,26 @@ class QueueVisualizer:
         # Message system
         self.message = ""
         self.message_color = TEXT_COLOR
-        self.message_timer = 0
+        self.message_expires = 0
+        self.message_surface = None
+        self.message_rect = None
         
         # Buttons
         self.buttons = self.create_buttons()
-        
-        # Statistics
-        self.operations_count = 0
-        self.start_time = time.time()
+        button_rects = [button_info['rect'] for button_info in self.buttons.values()]
+        self.buttons_area = button_rects[0].unionall(button_rects)
+        self.hovered = None
+
+        # Container plus the Front/Rear labels above and below it
+        self.queue_area = pygame.Rect(40, 235, (ITEM_WIDTH + ITEM_SPACING) * self.engine.capacity + ITEM_SPACING,
+                                      ITEM_HEIGHT + 105)
+
+        # Screen rectangles that need repainting, and what was last drawn
+        # there, to tell which ones changed.
+        self.dirty = [self.screen.get_rect()]
+        self.drawn_queue = ()
+        self.drawn_statistics = None
+        self.text_surfaces = {}
 
     def create_buttons(self):
         buttons = {
@@ -72,18 +84,31 @@ class QueueVisualizer:
         return buttons
 
     def show_message(self, text, color=TEXT_COLOR):
+        if self.message_rect:
+            self.dirty.append(self.message_rect)
         self.message = text
         self.message_color = color
-        self.message_timer = 2 * FPS  # Display for 2 seconds
+        self.message_expires = pygame.time.get_ticks() + MESSAGE_MS
+        self.message_surface = self.font.render(text, True, color)
+        self.message_rect = self.message_surface.get_rect(center=(SCREEN_WIDTH // 2, 200))
+        self.dirty.append(self.message_rect)
+
+    def text_surface(self, text, color):
+        # Item values, labels and button texts repeat, so each is rendered once.
+        surface = self.text_surfaces.get((text, color))
+        if surface is None:
+            surface = self.text_surfaces[text, color] = self.font.render(text, True, color)
+        return surface
 
     def enqueue(self):
-        if len(self.queue) >= QUEUE_CAPACITY:
+        value = self.engine.enqueue()
+        if value is None:
             self.show_message("Queue is full!", ERROR_COLOR)
             return
         
-        value = random.randint(1, 99)
+        self.stop_animation()
         start_pos = (SCREEN_WIDTH + ITEM_WIDTH, 300)
-        end_pos = self.get_item_position(len(self.queue))
+        end_pos = self.get_item_position(len(self.engine) - 1)
         
         self.animation_item = value
         self.animation_start_pos = start_pos
@@ -91,39 +116,62 @@ class QueueVisualizer:
         self.animating = True
         self.animation_progress = 0
         
-        self.queue.append(value)
-        self.operations_count += 1
         self.show_message(f"Enqueued: {value}", SUCCESS_COLOR)
 
     def dequeue(self):
-        if not self.queue:
+        value = self.engine.dequeue()
+        if value is None:
             self.show_message("Queue is empty!", ERROR_COLOR)
             return
         
-        value = self.queue.popleft()
-        self.operations_count += 1
+        # The items shift, so an item still flying in would land on the wrong slot.
+        self.stop_animation()
         self.show_message(f"Dequeued: {value}", SUCCESS_COLOR)
 
     def peek(self):
-        if not self.queue:
+        value = self.engine.peek()
+        if value is None:
             self.show_message("Queue is empty!", ERROR_COLOR)
             return
         
-        value = self.queue[0]
         self.show_message(f"Front element: {value}")
 
     def clear(self):
-        self.queue.clear()
+        self.engine.clear()
+        self.stop_animation()
         self.show_message("Queue cleared", SUCCESS_COLOR)
 
     def random_operations(self):
-        operations = ['enqueue', 'dequeue']
-        operation = random.choice(operations)
-        if operation == 'enqueue':
+        if self.engine.choose_operation() == 'enqueue':
             self.enqueue()
         else:
             self.dequeue()
 
+    def animation_position(self):
+        (x0, y0), (x1, y1) = self.animation_start_pos, self.animation_end_pos
+        t = self.animation_progress / 100
+        return int(x0 + (x1 - x0) * t), int(y0 + (y1 - y0) * t)
+
+    def animation_rect(self):
+        return pygame.Rect(self.animation_position(), (ITEM_WIDTH, ITEM_HEIGHT))
+
+    def advance_animation(self):
+        # Move the newly enqueued item one step towards its slot.
+        if not self.animating:
+            return
+        self.dirty.append(self.animation_rect())
+        self.animation_progress = min(self.animation_progress + ANIMATION_SPEED, 100)
+        if self.animation_progress == 100:
+            self.animating = False
+        self.dirty.append(self.animation_rect())
+
+    def stop_animation(self):
+        # The item jumps from where it is drawn now to its slot.
+        if self.animating:
+            self.dirty.append(self.animation_rect())
+            self.dirty.append(pygame.Rect(self.animation_end_pos, (ITEM_WIDTH, ITEM_HEIGHT)))
+            self.animating = False
+
     def get_item_position(self, index):
         x = 50 + index * (ITEM_WIDTH + ITEM_SPACING)
         y = 300
@@ -132,36 +180,37 @@ class QueueVisualizer:
     def draw_queue(self):
         # Draw queue container
         container_rect = pygame.Rect(40, 250, 
-                                   (ITEM_WIDTH + ITEM_SPACING) * QUEUE_CAPACITY + ITEM_SPACING,
+                                   (ITEM_WIDTH + ITEM_SPACING) * self.engine.capacity + ITEM_SPACING,
                                    ITEM_HEIGHT + 20)
         pygame.draw.rect(self.screen, QUEUE_BORDER_COLOR, container_rect, 3, border_radius=10)
         
         # Draw "Front" and "Rear" labels
-        if self.queue:
-            front_pos = self.get_item_position(0)
-            rear_pos = self.get_item_position(len(self.queue) - 1)
-            
-            # Jika hanya ada 1 elemen (front dan rear sama)
-            if len(self.queue) == 1:
-                # Front label di atas
-                front_text = self.font.render("Front", True, TEXT_COLOR)
-                self.screen.blit(front_text, (front_pos[0], front_pos[1] - 60))
-                
-                # Rear label di bawah
-                rear_text = self.font.render("Rear", True, TEXT_COLOR)
-                self.screen.blit(rear_text, (rear_pos[0], rear_pos[1] + ITEM_HEIGHT + 10))
-            else:
-                # Tampilan normal untuk multiple elements
-                front_text = self.font.render("Front", True, TEXT_COLOR)
-                rear_text = self.font.render("Rear", True, TEXT_COLOR)
-                self.screen.blit(front_text, (front_pos[0], front_pos[1] - 40))
-                self.screen.blit(rear_text, (rear_pos[0], rear_pos[1] - 40))
-
-        # Draw queue items
-        for i, value in enumerate(self.queue):
-            pos = self.get_item_position(i)
+        for text, pos in self.label_positions(len(self.engine)):
+            self.screen.blit(self.text_surface(text, TEXT_COLOR), pos)
+
+        # Draw queue items; one still flying in is drawn at its current spot.
+        flying = len(self.engine) - 1 if self.animating else None
+        for i, value in enumerate(self.engine):
+            pos = self.animation_position() if i == flying else self.get_item_position(i)
             self.draw_item(pos[0], pos[1], value)
 
+    def label_positions(self, size):
+        if not size:
+            return []
+        front_pos = self.get_item_position(0)
+        rear_pos = self.get_item_position(size - 1)
+        # Jika hanya ada 1 elemen (front dan rear sama)
+        if size == 1:
+            # Front label di atas, Rear label di bawah
+            return [("Front", (front_pos[0], front_pos[1] - 60)),
+                    ("Rear", (rear_pos[0], rear_pos[1] + ITEM_HEIGHT + 10))]
+        # Tampilan normal untuk multiple elements
+        return [("Front", (front_pos[0], front_pos[1] - 40)),
+                ("Rear", (rear_pos[0], rear_pos[1] - 40))]
+
+    def label_rects(self, size):
+        return [pygame.Rect(pos, self.font.size(text)) for text, pos in self.label_positions(size)]
+
     def draw_item(self, x, y, value):
         # Draw item box
         item_rect = pygame.Rect(x, y, ITEM_WIDTH, ITEM_HEIGHT)
@@ -169,68 +218,124 @@ class QueueVisualizer:
         pygame.draw.rect(self.screen, QUEUE_BORDER_COLOR, item_rect, 2, border_radius=5)
         
         # Draw value
-        value_text = self.font.render(str(value), True, TEXT_COLOR)
+        value_text = self.text_surface(str(value), TEXT_COLOR)
         text_rect = value_text.get_rect(center=(x + ITEM_WIDTH // 2, y + ITEM_HEIGHT // 2))
         self.screen.blit(value_text, text_rect)
 
     def draw_buttons(self):
-        mouse_pos = pygame.mouse.get_pos()
-        
-        for button_info in self.buttons.values():
+        for name, button_info in self.buttons.items():
             rect = button_info['rect']
-            color = BUTTON_HOVER_COLOR if rect.collidepoint(mouse_pos) else BUTTON_COLOR
+            color = BUTTON_HOVER_COLOR if name == self.hovered else BUTTON_COLOR
             
             # Draw button
             pygame.draw.rect(self.screen, color, rect, border_radius=5)
             pygame.draw.rect(self.screen, QUEUE_BORDER_COLOR, rect, 2, border_radius=5)
             
             # Draw text
-            text = self.font.render(button_info['text'], True, BUTTON_TEXT_COLOR)
+            text = self.text_surface(button_info['text'], BUTTON_TEXT_COLOR)
             text_rect = text.get_rect(center=rect.center)
             self.screen.blit(text, text_rect)
 
-    def draw_statistics(self):
-        stats_text = [
-            f"Operations: {self.operations_count}",
-            f"Queue Size: {len(self.queue)}/{QUEUE_CAPACITY}",
-            f"Time: {int(time.time() - self.start_time)}s"
+    def statistics_text(self):
+        return [
+            f"Operations: {self.engine.operations_count}",
+            f"Queue Size: {len(self.engine)}/{self.engine.capacity}",
+            f"Time: {int(self.engine.elapsed())}s"
         ]
-        
+
+    def draw_statistics(self):
         y = 50
-        for text in stats_text:
+        for text in self.drawn_statistics:
             surface = self.small_font.render(text, True, TEXT_COLOR)
             self.screen.blit(surface, (50, y))
             y += 30
 
+    def update_hover(self, mouse_pos):
+        hovered = None
+        for name, button_info in self.buttons.items():
+            if button_info['rect'].collidepoint(mouse_pos):
+                hovered = name
+        if hovered != self.hovered:
+            for name in (self.hovered, hovered):
+                if name is not None:
+                    self.dirty.append(self.buttons[name]['rect'])
+            self.hovered = hovered
+
+    def find_changes(self):
+        # Compare the queue, message and statistics with what is on screen
+        # and mark only the parts that differ.
+        values = tuple(self.engine)
+        if values != self.drawn_queue:
+            for i in range(max(len(values), len(self.drawn_queue))):
+                if values[i:i + 1] != self.drawn_queue[i:i + 1]:
+                    x, y = self.get_item_position(i)
+                    self.dirty.append(pygame.Rect(x, y, ITEM_WIDTH, ITEM_HEIGHT))
+            if len(values) != len(self.drawn_queue):
+                self.dirty += self.label_rects(len(self.drawn_queue)) + self.label_rects(len(values))
+            self.drawn_queue = values
+
+        if self.message and pygame.time.get_ticks() >= self.message_expires:
+            self.message = ""
+            self.dirty.append(self.message_rect)
+
+        statistics = self.statistics_text()
+        if statistics != self.drawn_statistics:
+            self.drawn_statistics = statistics
+            self.dirty.append(STATS_AREA)
+
+    def draw_dirty(self):
+        # Repaint each dirty rectangle with drawing clipped to it, so only
+        # the parts that overlap it are touched, then push just those
+        # rectangles to the display.
+        for rect in self.dirty:
+            self.screen.set_clip(rect)
+            self.screen.fill(BACKGROUND_COLOR)
+            if rect.colliderect(self.queue_area) or (self.animating and rect.colliderect(self.animation_rect())):
+                self.draw_queue()
+            if rect.colliderect(self.buttons_area):
+                self.draw_buttons()
+            if rect.colliderect(STATS_AREA):
+                self.draw_statistics()
+            if self.message and rect.colliderect(self.message_rect):
+                self.screen.blit(self.message_surface, self.message_rect)
+        self.screen.set_clip(None)
+        pygame.display.update(self.dirty)
+        self.dirty = []
+
+    def idle_timeout(self):
+        # Milliseconds until something changes on its own: the Time
+        # statistic ticking over or the message expiring.
+        timeout = 1000 - int(self.engine.elapsed() * 1000) % 1000
+        if self.message:
+            timeout = min(timeout, self.message_expires - pygame.time.get_ticks())
+        return max(timeout, 1)
+
     def run(self):
+        self.update_hover(pygame.mouse.get_pos())
         running = True
         while running:
-            for event in pygame.event.get():
+            if self.animating:
+                events = pygame.event.get()
+            else:
+                # Nothing is moving: sleep until input arrives or the next
+                # timed change is due.
+                events = [pygame.event.wait(self.idle_timeout())] + pygame.event.get()
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type == pygame.MOUSEMOTION:
+                    self.update_hover(event.pos)
                 elif event.type == pygame.MOUSEBUTTONDOWN:
-                    mouse_pos = pygame.mouse.get_pos()
                     for button_info in self.buttons.values():
-                        if button_info['rect'].collidepoint(mouse_pos):
+                        if button_info['rect'].collidepoint(event.pos):
                             button_info['action']()
+                elif event.type == pygame.WINDOWEXPOSED:
+                    self.dirty.append(self.screen.get_rect())
 
-            # Clear screen
-            self.screen.fill(BACKGROUND_COLOR)
-
-            # Draw queue and UI elements
-            self.draw_queue()
-            self.draw_buttons()
-            self.draw_statistics()
-
-            # Draw message if active
-            if self.message_timer > 0:
-                message_surface = self.font.render(self.message, True, self.message_color)
-                message_rect = message_surface.get_rect(center=(SCREEN_WIDTH // 2, 200))
-                self.screen.blit(message_surface, message_rect)
-                self.message_timer -= 1
-
-            # Update display
-            pygame.display.flip()
+            self.advance_animation()
+            self.find_changes()
+            if self.dirty:
+                self.draw_dirty()
             self.clock.tick(FPS)
 
         pygame.quit()